@@ -26,7 +26,7 @@ from .state_tools import (
     workflow_get_cost_summary,
     workflow_get_worktree_info,
     workflow_mark_docs_needed,
-    workflow_add_review_issue,
+    workflow_add_review_issues,
     workflow_add_concern,
     workflow_log_interaction,
     _load_state,
@@ -46,12 +46,17 @@ from .config_tools import (
 # Helpers
 # ============================================================================
 
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9\s_-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s_]+')
+_SLUG_DASHES_RE = re.compile(r'-+')
+
+
 def _slugify(text: str) -> str:
     """Convert text to git-branch-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r'[^a-z0-9\s_-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = _SLUG_INVALID_RE.sub('', text)
+    text = _SLUG_SEPARATOR_RE.sub('-', text)
+    text = _SLUG_DASHES_RE.sub('-', text)
     return text.strip('-')
 
 
@@ -957,16 +962,20 @@ def crew_parse_agent_output(
         try:
             issues = json.loads(issues_match.group(1))
             extracted["review_issues"] = issues
-            for issue in issues:
-                if task_id and isinstance(issue, dict):
-                    workflow_add_review_issue(
-                        issue_type=issue.get("type", "review"),
-                        description=issue.get("description", str(issue)),
-                        severity=issue.get("severity", "medium"),
-                        task_id=task_id
-                    )
-                elif task_id and isinstance(issue, str):
-                    workflow_add_review_issue(issue_type="review", description=issue, task_id=task_id)
+            if task_id:
+                # Record every parsed issue with one state write
+                to_add = []
+                for issue in issues:
+                    if isinstance(issue, dict):
+                        to_add.append({
+                            "issue_type": issue.get("type", "review"),
+                            "description": issue.get("description", str(issue)),
+                            "severity": issue.get("severity", "medium"),
+                        })
+                    elif isinstance(issue, str):
+                        to_add.append({"issue_type": "review", "description": issue})
+                if to_add:
+                    workflow_add_review_issues(to_add, task_id=task_id)
             if issues:
                 has_blocking_issues = True
         except json.JSONDecodeError:
@@ -29,6 +29,7 @@ from .state_tools import (
     workflow_transition,
     workflow_get_state,
     workflow_add_review_issue,
+    workflow_add_review_issues,
     workflow_mark_docs_needed,
     workflow_complete_phase,
     workflow_is_complete,
@@ -200,6 +201,47 @@ TOOLS = [
             "required": ["issue_type", "description"]
         }
     ),
+    Tool(
+        name="workflow_add_review_issues",
+        description="Add several review issues at once with a single state write.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_id": {
+                    "type": "string",
+                    "description": "Task identifier. If not provided, uses active task."
+                },
+                "issues": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "issue_type": {
+                                "type": "string",
+                                "description": "Type of issue (e.g., 'missing_test', 'security', 'performance')"
+                            },
+                            "description": {
+                                "type": "string",
+                                "description": "Description of the issue"
+                            },
+                            "step": {
+                                "type": "string",
+                                "description": "Optional step reference (e.g., '2.3')"
+                            },
+                            "severity": {
+                                "type": "string",
+                                "description": "Issue severity",
+                                "enum": ["low", "medium", "high", "critical"]
+                            }
+                        },
+                        "required": ["issue_type", "description"]
+                    },
+                    "description": "Issues to add, in order"
+                }
+            },
+            "required": ["issues"]
+        }
+    ),
     Tool(
         name="workflow_mark_docs_needed",
         description="Flag files that need documentation by the Technical Writer phase.",
@@ -713,6 +755,11 @@ TOOLS = [
                 "preferred_model": {
                     "type": "string",
                     "description": "Optional preferred model to try first before fallback chain"
+                },
+                "include_diagnostics": {
+                    "type": "boolean",
+                    "description": "Check every model in the chain and report each in checked_models. Set to false to stop at the first available model and return an empty checked_models",
+                    "default": True
                 }
             },
             "required": []
@@ -1548,6 +1595,7 @@ TOOL_DISPATCH_TABLE = {
     "workflow_transition": workflow_transition,
     "workflow_get_state": workflow_get_state,
     "workflow_add_review_issue": workflow_add_review_issue,
+    "workflow_add_review_issues": workflow_add_review_issues,
     "workflow_mark_docs_needed": workflow_mark_docs_needed,
     "workflow_complete_phase": workflow_complete_phase,
     "workflow_is_complete": workflow_is_complete,
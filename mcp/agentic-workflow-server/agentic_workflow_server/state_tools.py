@@ -12,11 +12,19 @@ import os
 import re
 import shlex
 import subprocess
+import tempfile
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from filelock import FileLock
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Resolve script paths at import time (immune to Path mocking in tests)
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
@@ -32,6 +40,9 @@ PHASE_ORDER = [
     "technical_writer"
 ]
 
+# Position of each phase in PHASE_ORDER, for O(1) ordering checks
+PHASE_INDEX = {phase: i for i, phase in enumerate(PHASE_ORDER)}
+
 REQUIRED_PHASES = [
     "architect",
     "developer",
@@ -40,6 +51,8 @@ REQUIRED_PHASES = [
     "technical_writer"
 ]
 
+REQUIRED_PHASES_SET = frozenset(REQUIRED_PHASES)
+
 DISCOVERY_CATEGORIES = [
     "decision",
     "pattern",
@@ -75,34 +88,62 @@ CREW_COLOR_SCHEMES = [
 
 _cached_tasks_dir: Optional[Path] = None
 
+# `git rev-parse --git-common-dir` per working directory (None when not in git)
+_git_common_dir_cache: dict[str, Optional[Path]] = {}
 
-def _resolve_main_repo_tasks_dir() -> Optional[Path]:
-    """Resolve .tasks/ dir to the main repo when running in a git worktree.
+# Case-insensitive task_id lookups resolved by scanning, keyed by (tasks_dir, task_id)
+_task_dir_cache: dict[tuple[Path, str], Path] = {}
 
-    Uses `git rev-parse --git-common-dir`:
-    - Normal repo: returns `.git` (relative) → cwd/.tasks/
-    - Worktree: returns absolute path to main .git → main_repo/.tasks/
-    - Not in git: returns None → fall back to cwd/.tasks/
+# Fields active-task resolution reads from each state.json, keyed by the
+# file's (mtime_ns, size, inode) so unchanged tasks are not re-parsed
+_task_summary_cache: dict[Path, tuple[tuple[int, int, int], dict]] = {}
+
+
+def _get_git_common_dir() -> Optional[Path]:
+    """Return ``git rev-parse --git-common-dir`` for the cwd, memoized per cwd.
+
+    The answer only changes if the repo layout itself changes, so the
+    subprocess runs once per process and directory instead of on every
+    active-task lookup.
     """
+    cwd = os.getcwd()
+    if cwd in _git_common_dir_cache:
+        return _git_common_dir_cache[cwd]
+
+    git_common_dir = None
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--git-common-dir"],
             capture_output=True, text=True, timeout=5
         )
-        if result.returncode != 0:
-            return None
+        if result.returncode == 0:
+            git_common_dir = Path(result.stdout.strip())
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
 
-        git_common_dir = Path(result.stdout.strip())
+    _git_common_dir_cache[cwd] = git_common_dir
+    return git_common_dir
 
-        if git_common_dir.is_absolute():
-            # Worktree: git-common-dir is absolute path to main .git
-            return git_common_dir.parent / ".tasks"
-        else:
-            # Normal repo: git-common-dir is relative (e.g., ".git")
-            return Path.cwd() / ".tasks"
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+
+def _resolve_main_repo_tasks_dir() -> Optional[Path]:
+    """Resolve .tasks/ dir to the main repo when running in a git worktree.
+
+    Uses `git rev-parse --git-common-dir`:
+    - Normal repo: returns `.git` (relative) → cwd/.tasks/
+    - Worktree: returns absolute path to main .git → main_repo/.tasks/
+    - Not in git: returns None → fall back to cwd/.tasks/
+    """
+    git_common_dir = _get_git_common_dir()
+    if git_common_dir is None:
         return None
 
+    if git_common_dir.is_absolute():
+        # Worktree: git-common-dir is absolute path to main .git
+        return git_common_dir.parent / ".tasks"
+    else:
+        # Normal repo: git-common-dir is relative (e.g., ".git")
+        return Path.cwd() / ".tasks"
+
 
 def get_tasks_dir() -> Path:
     global _cached_tasks_dir
@@ -116,37 +157,96 @@ def get_tasks_dir() -> Path:
 
 def find_task_dir(task_id: Optional[str] = None) -> Optional[Path]:
     if task_id:
-        task_dir = get_tasks_dir() / task_id
+        tasks_dir = get_tasks_dir()
+        task_dir = tasks_dir / task_id
         if task_dir.exists():
             return task_dir
-        tasks_dir = get_tasks_dir()
+
+        # Case-insensitive match: reuse a previous scan while the dir still exists
+        key = (tasks_dir, task_id)
+        cached = _task_dir_cache.get(key)
+        if cached is not None:
+            if cached.is_dir():
+                return cached
+            del _task_dir_cache[key]
+
         if tasks_dir.exists():
-            for d in tasks_dir.iterdir():
-                if d.is_dir() and d.name.lower() == task_id.lower():
-                    return d
+            task_id_lower = task_id.lower()
+            # Compare names before is_dir() so non-matching entries cost nothing
+            with os.scandir(tasks_dir) as it:
+                for entry in it:
+                    if entry.name.lower() == task_id_lower and entry.is_dir():
+                        d = tasks_dir / entry.name
+                        _task_dir_cache[key] = d
+                        return d
         return None
 
     return _find_active_task_dir()
 
 
+def _list_task_dirs(tasks_dir: Path) -> list[Path]:
+    """Return the subdirectories of tasks_dir, sorted by name.
+
+    DirEntry.is_dir() answers from the readdir entry type, so unlike
+    Path.iterdir() + is_dir() there is no stat per entry.
+    """
+    with os.scandir(tasks_dir) as it:
+        names = sorted(entry.name for entry in it if entry.is_dir())
+    return [tasks_dir / name for name in names]
+
+
+def _task_summary(task_dir: Path) -> Optional[dict]:
+    """Return the fields task scans and list_tasks need from a state.json.
+
+    Cached per task until state.json changes. Returns None when the task has no state.json. Parse errors propagate.
+    """
+    state_file = task_dir / "state.json"
+    key = _file_stat_key(state_file)
+    if key is None:
+        return None
+
+    cached = _task_summary_cache.get(task_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Share the bytes with _load_state so the tool call that follows a
+    # scan doesn't read the same state.json again
+    cached_state = _state_cache.get(task_dir)
+    if cached_state is not None and cached_state[0] == key:
+        state = _parse_json_bytes(cached_state[1])
+    else:
+        raw = state_file.read_bytes()
+        state = _parse_json_bytes(raw)
+        _state_cache[task_dir] = (key, raw, _tracked_state_fields(state))
+    completed = set(_normalize_phase(p) for p in state.get("phases_completed", []))
+    if state.get("phase"):
+        completed.add(_normalize_phase(state["phase"]))
+    # Use mode-specific phases if available
+    mode_phases = state.get("workflow_mode", {}).get("phases")
+    required = [_normalize_phase(p) for p in mode_phases] if mode_phases else REQUIRED_PHASES
+    summary = {
+        "status": state.get("status"),
+        "phase": state.get("phase"),
+        "iteration": state.get("iteration", 1),
+        "worktree": state.get("worktree"),
+        "updated_at": state.get("updated_at"),
+        "incomplete": any(p not in completed for p in required),
+        # list_tasks judges completeness by REQUIRED_PHASES, whatever the mode
+        "required_complete": REQUIRED_PHASES_SET <= completed,
+    }
+    _task_summary_cache[task_dir] = (key, summary)
+    return summary
+
+
 def _detect_worktree_task_id() -> Optional[str]:
     """If running inside a git worktree, find the task ID that owns it.
 
     Checks each task's worktree metadata to see if its path matches cwd.
     Returns the task_id if found, None if not in a worktree or no match.
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-common-dir"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode != 0:
-            return None
-        git_common_dir = Path(result.stdout.strip())
-        if not git_common_dir.is_absolute():
-            # Not a worktree (normal repo)
-            return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+    git_common_dir = _get_git_common_dir()
+    if git_common_dir is None or not git_common_dir.is_absolute():
+        # Not in git, or not a worktree (normal repo)
         return None
 
     # We're in a worktree. Match cwd against task worktree paths.
@@ -155,24 +255,22 @@ def _detect_worktree_task_id() -> Optional[str]:
     if not tasks_dir.exists():
         return None
 
-    for task_dir in tasks_dir.iterdir():
-        if task_dir.is_dir():
-            state_file = task_dir / "state.json"
-            if state_file.exists():
-                try:
-                    with open(state_file) as f:
-                        state = json.load(f)
-                    wt = state.get("worktree")
-                    if wt and wt.get("status") == "active" and wt.get("path"):
-                        # Resolve the worktree path relative to the main repo
-                        main_repo = git_common_dir.parent
-                        wt_abs = str(Path(os.path.normpath(
-                            os.path.join(str(main_repo), wt["path"])
-                        )).resolve())
-                        if wt_abs == cwd:
-                            return task_dir.name
-                except (json.JSONDecodeError, OSError):
-                    continue
+    for task_dir in _list_task_dirs(tasks_dir):
+        try:
+            summary = _task_summary(task_dir)
+            if summary is None:
+                continue
+            wt = summary["worktree"]
+            if wt and wt.get("status") == "active" and wt.get("path"):
+                # Resolve the worktree path relative to the main repo
+                main_repo = git_common_dir.parent
+                wt_abs = str(Path(os.path.normpath(
+                    os.path.join(str(main_repo), wt["path"])
+                )).resolve())
+                if wt_abs == cwd:
+                    return task_dir.name
+        except (ValueError, OSError):
+            continue
     return None
 
 
@@ -196,59 +294,143 @@ def _find_active_task_dir() -> Optional[Path]:
             task_id = active_file.read_text().strip()
             if task_id:
                 task_dir = tasks_dir / task_id
-                state_file = task_dir / "state.json"
-                if state_file.exists():
-                    with open(state_file) as f:
-                        state = json.load(f)
-                    # Only use if task isn't completed (stale marker cleanup)
-                    if state.get("status") != "completed":
-                        return task_dir
-        except (OSError, json.JSONDecodeError):
+                summary = _task_summary(task_dir)
+                # Only use if task isn't completed (stale marker cleanup)
+                if summary is not None and summary["status"] != "completed":
+                    return task_dir
+        except (OSError, ValueError):
             pass
 
     # Fallback: find the most recently updated incomplete task
     active_tasks = []
-    for task_dir in tasks_dir.iterdir():
-        if task_dir.is_dir():
-            state_file = task_dir / "state.json"
-            if state_file.exists():
-                with open(state_file) as f:
-                    state = json.load(f)
-                    # Skip completed tasks
-                    if state.get("status") == "completed":
-                        continue
-                    # Skip tasks with active worktrees — they're worked on elsewhere
-                    wt = state.get("worktree")
-                    if wt and wt.get("status") == "active":
-                        continue
-                    completed = set(_normalize_phase(p) for p in state.get("phases_completed", []))
-                    if state.get("phase"):
-                        completed.add(_normalize_phase(state["phase"]))
-                    # Use mode-specific phases if available
-                    mode_phases = state.get("workflow_mode", {}).get("phases")
-                    required = [_normalize_phase(p) for p in mode_phases] if mode_phases else REQUIRED_PHASES
-                    missing = [p for p in required if p not in completed]
-                    if missing:
-                        active_tasks.append((task_dir, state.get("updated_at", "")))
+    for task_dir in _list_task_dirs(tasks_dir):
+        summary = _task_summary(task_dir)
+        if summary is None:
+            continue
+        # Skip completed tasks
+        if summary["status"] == "completed":
+            continue
+        # Skip tasks with active worktrees — they're worked on elsewhere
+        wt = summary["worktree"]
+        if wt and wt.get("status") == "active":
+            continue
+        if summary["incomplete"]:
+            active_tasks.append((task_dir, summary["updated_at"] or ""))
 
     if active_tasks:
-        active_tasks.sort(key=lambda x: x[1], reverse=True)
-        return active_tasks[0][0]
+        # max() keeps the first of equal timestamps, as the stable sort did
+        return max(active_tasks, key=lambda x: x[1])[0]
 
     return None
 
 
+def _parse_json_bytes(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    return _parse_json_bytes(path.read_bytes())
+
+
+def _read_jsonl(path: Path) -> list:
+    """Parse every record of a JSONL file in one read, skipping malformed lines."""
+    records = []
+    for line in path.read_bytes().splitlines():
+        # Both parsers accept surrounding whitespace, so no per-line strip
+        if not line:
+            continue
+        try:
+            records.append(_parse_json_bytes(line))
+        except ValueError:
+            continue
+    return records
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-str dict keys, which the stdlib encoder coerces
+            pass
+    # Raw UTF-8 like orjson, so the bytes don't depend on which encoder ran
+    try:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form: keep them as \u escapes
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dump_json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSONL record, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    # Compact separators and raw UTF-8 match orjson's output byte for byte
+    try:
+        return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    except UnicodeEncodeError:
+        return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# Last seen state.json bytes per task dir, plus the fields _log_state_changes
+# compares, keyed by the file's (mtime_ns, size, inode)
+_state_cache: dict[Path, tuple[tuple[int, int, int], bytes, dict]] = {}
+
+
+def _file_stat_key(state_file: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = state_file.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _tracked_state_fields(state: dict) -> dict:
+    """Copy of the fields _log_state_changes diffs between saves."""
+    return {
+        "phase": state.get("phase"),
+        "status": state.get("status"),
+        "phases_completed": list(state.get("phases_completed", [])),
+        "workflow_mode": {"effective": state.get("workflow_mode", {}).get("effective")},
+    }
+
+
 def _load_state(task_dir: Path) -> dict:
+    """Load a task's state.json.
+
+    While the file is unchanged since it was last read or written here,
+    the cached bytes are parsed instead, skipping the lock and the read.
+    Every call returns a fresh dict that callers may mutate.
+    """
     state_file = task_dir / "state.json"
-    if state_file.exists():
-        lock_file = task_dir / "state.json.lock"
-        with FileLock(str(lock_file)):
-            with open(state_file) as f:
-                return json.load(f)
-    return _create_default_state(task_dir.name)
+    key = _file_stat_key(state_file)
+    if key is None:
+        return _create_default_state(task_dir.name)
+
+    cached = _state_cache.get(task_dir)
+    if cached is not None and cached[0] == key:
+        return _parse_json_bytes(cached[1])
+
+    lock_file = task_dir / "state.json.lock"
+    with FileLock(str(lock_file)):
+        key = _file_stat_key(state_file)
+        raw = state_file.read_bytes()
+    state = _parse_json_bytes(raw)
+    if key is not None:
+        _state_cache[task_dir] = (key, raw, _tracked_state_fields(state))
+    return state
 
 
 def _create_default_state(task_id: str) -> dict:
+    now_iso = datetime.now().isoformat()
     return {
         "task_id": task_id,
         "phase": None,
@@ -268,11 +450,19 @@ def _create_default_state(task_id: str) -> dict:
         },
         "concerns": [],
         "worktree": None,
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
+        "created_at": now_iso,
+        "updated_at": now_iso
     }
 
 
+def _append_interaction(task_dir: Path, entry: dict) -> None:
+    """Append one entry to interactions.jsonl, serialized before taking the lock."""
+    line = _dump_json_line(entry)
+    with FileLock(str(task_dir / "interactions.jsonl.lock"), timeout=5):
+        with open(task_dir / "interactions.jsonl", "ab") as f:
+            f.write(line)
+
+
 def _log_state_changes(task_dir: Path, old_state: dict, new_state: dict) -> None:
     """Append a state_change entry to interactions.jsonl when tracked fields change."""
     try:
@@ -316,11 +506,7 @@ def _log_state_changes(task_dir: Path, old_state: dict, new_state: dict) -> None
             "metadata": {"changes": changes},
         }
 
-        interactions_file = task_dir / "interactions.jsonl"
-        lock_file = task_dir / "interactions.jsonl.lock"
-        with FileLock(str(lock_file), timeout=5):
-            with open(interactions_file, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+        _append_interaction(task_dir, entry)
     except Exception:
         pass  # Never block state persistence
 
@@ -333,32 +519,45 @@ def _save_state(task_dir: Path, state: dict) -> None:
 
     old_state = None
     with FileLock(str(lock_file)):
-        if state_file.exists():
-            try:
-                with open(state_file, "r") as f:
-                    old_state = json.load(f)
-            except Exception:
-                old_state = None
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        key = _file_stat_key(state_file)
+        if key is not None:
+            cached = _state_cache.get(task_dir)
+            if cached is not None and cached[0] == key:
+                old_state = cached[2]
+            else:
+                try:
+                    old_state = _read_json_file(state_file)
+                except Exception:
+                    old_state = None
+        raw = _dump_json_bytes(state)
+        # Replace rather than truncate-and-write so readers never see a partial file
+        _write_bytes_atomic(state_file, raw)
+        key = _file_stat_key(state_file)
+
+    if key is not None:
+        _state_cache[task_dir] = (key, raw, _tracked_state_fields(state))
 
     if old_state is not None:
         _log_state_changes(task_dir, old_state, state)
 
 
+_TASK_ID_RE = re.compile(r"TASK_(\d+)")
+
+
 def _get_next_task_id() -> str:
     tasks_dir = get_tasks_dir()
     if not tasks_dir.exists():
         return "TASK_001"
 
-    existing = []
-    for d in tasks_dir.iterdir():
-        if d.is_dir():
-            match = re.match(r"TASK_(\d+)", d.name)
-            if match:
-                existing.append(int(match.group(1)))
+    highest = 0
+    with os.scandir(tasks_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                match = _TASK_ID_RE.match(entry.name)
+                if match:
+                    highest = max(highest, int(match.group(1)))
 
-    next_num = max(existing, default=0) + 1
+    next_num = highest + 1
     return f"TASK_{next_num:03d}"
 
 
@@ -369,18 +568,13 @@ def _normalize_phase(phase: str) -> str:
 def _can_transition(state: dict, to_phase: str) -> tuple[bool, str]:
     to_phase = _normalize_phase(to_phase)
 
-    # Build the valid phase list: PHASE_ORDER + any custom phases from the mode
+    # Valid phases: PHASE_ORDER + any custom phases from the mode
     mode_phases = state.get("workflow_mode", {}).get("phases", [])
-    valid_phases = list(PHASE_ORDER)
-    for p in mode_phases:
-        if p not in valid_phases:
-            valid_phases.append(p)
-
-    if to_phase not in valid_phases:
+    if to_phase not in PHASE_INDEX and to_phase not in mode_phases:
         return False, f"Invalid phase: {to_phase}"
 
     current = _normalize_phase(state["phase"]) if state.get("phase") else None
-    phases_completed = [_normalize_phase(p) for p in state.get("phases_completed", [])]
+    phases_completed = {_normalize_phase(p) for p in state.get("phases_completed", [])}
 
     if current is None:
         if to_phase == "architect":
@@ -399,12 +593,19 @@ def _can_transition(state: dict, to_phase: str) -> tuple[bool, str]:
         return False, f"Phase {to_phase} already completed"
 
     # Use mode_phases as the ordering if available, else fall back to PHASE_ORDER
-    ordering = mode_phases if mode_phases else PHASE_ORDER
+    if mode_phases:
+        ordering = mode_phases
+        phase_index: dict[str, int] = {}
+        for i, p in enumerate(mode_phases):
+            phase_index.setdefault(p, i)
+    else:
+        ordering = PHASE_ORDER
+        phase_index = PHASE_INDEX
 
-    if current in ordering and to_phase in ordering:
-        current_idx = ordering.index(current)
-        to_idx = ordering.index(to_phase)
+    current_idx = phase_index.get(current)
+    to_idx = phase_index.get(to_phase)
 
+    if current_idx is not None and to_idx is not None:
         if to_idx == current_idx + 1:
             return True, f"Valid forward transition from {current} to {to_phase}"
 
@@ -414,7 +615,7 @@ def _can_transition(state: dict, to_phase: str) -> tuple[bool, str]:
                 skipped = [ordering[i] for i in range(current_idx + 1, to_idx)]
                 if all(p not in mode_phases for p in skipped):
                     return True, f"Valid forward skip from {current} to {to_phase} (skipped phases not in mode)"
-    elif current not in ordering and to_phase in ordering:
+    elif current_idx is None and to_idx is not None:
         # Current phase is custom/unknown, allow transition to any mode phase
         return True, f"Transition from custom phase {current} to {to_phase}"
 
@@ -515,6 +716,7 @@ def workflow_get_state(task_id: Optional[str] = None) -> dict[str, Any]:
     completed = set(_normalize_phase(p) for p in state.get("phases_completed", []))
     if state.get("phase"):
         completed.add(_normalize_phase(state["phase"]))
+    # Kept as an ordered list: missing_phases is shown in phase order
     missing = [p for p in REQUIRED_PHASES if p not in completed]
     is_complete = len(missing) == 0
 
@@ -534,6 +736,24 @@ def workflow_get_state(task_id: Optional[str] = None) -> dict[str, Any]:
     }
 
 
+def _make_review_issue(
+    issue_type: str,
+    description: str,
+    added_at: str,
+    step: Optional[str] = None,
+    severity: str = "medium"
+) -> dict[str, Any]:
+    issue = {
+        "type": issue_type,
+        "description": description,
+        "severity": severity,
+        "added_at": added_at
+    }
+    if step:
+        issue["step"] = step
+    return issue
+
+
 def workflow_add_review_issue(
     issue_type: str,
     description: str,
@@ -550,14 +770,7 @@ def workflow_add_review_issue(
 
     state = _load_state(task_dir)
 
-    issue = {
-        "type": issue_type,
-        "description": description,
-        "severity": severity,
-        "added_at": datetime.now().isoformat()
-    }
-    if step:
-        issue["step"] = step
+    issue = _make_review_issue(issue_type, description, datetime.now().isoformat(), step, severity)
 
     if "review_issues" not in state:
         state["review_issues"] = []
@@ -573,6 +786,58 @@ def workflow_add_review_issue(
     }
 
 
+def workflow_add_review_issues(
+    issues: list[dict[str, Any]],
+    task_id: Optional[str] = None
+) -> dict[str, Any]:
+    """Add several review issues with a single state.json write.
+
+    Each item takes workflow_add_review_issue's fields: issue_type and
+    description, plus optional step and severity.
+    """
+    task_dir = find_task_dir(task_id)
+    if not task_dir:
+        return {
+            "success": False,
+            "error": "No active task found" if not task_id else f"Task {task_id} not found"
+        }
+
+    for i, item in enumerate(issues):
+        if "issue_type" not in item or "description" not in item:
+            return {
+                "success": False,
+                "error": f"Issue {i} needs both issue_type and description"
+            }
+
+    state = _load_state(task_dir)
+
+    added_at = datetime.now().isoformat()
+    added = [
+        _make_review_issue(
+            item["issue_type"],
+            item["description"],
+            added_at,
+            item.get("step"),
+            item.get("severity", "medium")
+        )
+        for item in issues
+    ]
+
+    if "review_issues" not in state:
+        state["review_issues"] = []
+    state["review_issues"].extend(added)
+
+    if added:
+        _save_state(task_dir, state)
+
+    return {
+        "success": True,
+        "issues": added,
+        "total_issues": len(state["review_issues"]),
+        "task_id": state.get("task_id")
+    }
+
+
 def workflow_mark_docs_needed(
     files: list[str],
     task_id: Optional[str] = None
@@ -586,10 +851,11 @@ def workflow_mark_docs_needed(
 
     state = _load_state(task_dir)
 
-    existing = set(state.get("docs_needed", []))
-    new_files = [f for f in files if f not in existing]
-    existing.update(files)
-    state["docs_needed"] = list(existing)
+    docs_needed = state.get("docs_needed", [])
+    existing = set(docs_needed)
+    # dict.fromkeys drops repeats within files while keeping their order
+    new_files = [f for f in dict.fromkeys(files) if f not in existing]
+    state["docs_needed"] = docs_needed + new_files
 
     _save_state(task_dir, state)
 
@@ -627,6 +893,7 @@ def workflow_complete_phase(task_id: Optional[str] = None) -> dict[str, Any]:
 
     completed = set(_normalize_phase(p) for p in state.get("phases_completed", []))
     completed.add(_normalize_phase(current))
+    # Kept as an ordered list: remaining_phases is shown in phase order
     missing = [p for p in REQUIRED_PHASES if p not in completed]
 
     return {
@@ -780,52 +1047,47 @@ def list_tasks() -> list[dict[str, Any]]:
         return []
 
     tasks = []
-    for task_dir in sorted(tasks_dir.iterdir()):
-        if task_dir.is_dir():
-            state_file = task_dir / "state.json"
-            if state_file.exists():
-                state = _load_state(task_dir)
-                completed = set(_normalize_phase(p) for p in state.get("phases_completed", []))
-                if state.get("phase"):
-                    completed.add(_normalize_phase(state["phase"]))
-                missing = [p for p in REQUIRED_PHASES if p not in completed]
-                is_complete = len(missing) == 0
-
-                # Worktree metadata
-                worktree = state.get("worktree")
-                wt_status = None
-                wt_path = None
-                wt_branch = None
-                wt_action = None
-
-                if worktree:
-                    wt_status = worktree.get("status")
-                    wt_path = worktree.get("path")
-                    wt_branch = worktree.get("branch")
-
-                    if wt_status == "active" and is_complete:
-                        wt_action = "cleanup"
-                    elif wt_status == "active" and not is_complete:
-                        wt_action = "resume"
-                    elif wt_status in ("cleaned", "recycled"):
-                        wt_action = "done"
-                    elif wt_status == "recyclable":
-                        wt_action = "recyclable"
-
-                task_entry = {
-                    "task_id": task_dir.name,
-                    "phase": state.get("phase"),
-                    "iteration": state.get("iteration", 1),
-                    "is_complete": is_complete,
-                    "updated_at": state.get("updated_at"),
-                    "worktree": {
-                        "status": wt_status,
-                        "path": wt_path,
-                        "branch": wt_branch,
-                        "action": wt_action,
-                    } if worktree else None,
-                }
-                tasks.append(task_entry)
+    for task_dir in _list_task_dirs(tasks_dir):
+        summary = _task_summary(task_dir)
+        if summary is None:
+            continue
+        is_complete = summary["required_complete"]
+
+        # Worktree metadata
+        worktree = summary["worktree"]
+        wt_status = None
+        wt_path = None
+        wt_branch = None
+        wt_action = None
+
+        if worktree:
+            wt_status = worktree.get("status")
+            wt_path = worktree.get("path")
+            wt_branch = worktree.get("branch")
+
+            if wt_status == "active" and is_complete:
+                wt_action = "cleanup"
+            elif wt_status == "active" and not is_complete:
+                wt_action = "resume"
+            elif wt_status in ("cleaned", "recycled"):
+                wt_action = "done"
+            elif wt_status == "recyclable":
+                wt_action = "recyclable"
+
+        task_entry = {
+            "task_id": task_dir.name,
+            "phase": summary["phase"],
+            "iteration": summary["iteration"],
+            "is_complete": is_complete,
+            "updated_at": summary["updated_at"],
+            "worktree": {
+                "status": wt_status,
+                "path": wt_path,
+                "branch": wt_branch,
+                "action": wt_action,
+            } if worktree else None,
+        }
+        tasks.append(task_entry)
 
     return tasks
 
@@ -973,6 +1235,25 @@ def workflow_set_kb_inventory(
     }
 
 
+def _find_by_id(items: list[dict], item_id: str, prefix: str) -> Optional[dict]:
+    """Find the item with the given ID in a list of generated-ID records.
+
+    Generated IDs are positional (C001 is concerns[0], A002 is
+    assertions[1]), so those are checked directly before falling back
+    to a scan for custom IDs.
+    """
+    if item_id.startswith(prefix) and item_id[len(prefix):].isdigit():
+        idx = int(item_id[len(prefix):]) - 1
+        if 0 <= idx < len(items) and items[idx].get("id") == item_id:
+            return items[idx]
+    return next((item for item in items if item.get("id") == item_id), None)
+
+
+def _find_concern(state: dict, concern_id: str) -> Optional[dict]:
+    """Return the concern with the given ID, or None."""
+    return _find_by_id(state.get("concerns", []), concern_id, "C")
+
+
 def workflow_add_concern(
     source: str,
     severity: str,
@@ -1031,26 +1312,22 @@ def workflow_address_concern(
 
     state = _load_state(task_dir)
 
-    if "concerns" not in state:
+    concern = _find_concern(state, concern_id)
+    if concern is None:
         return {
             "success": False,
             "error": f"Concern {concern_id} not found"
         }
 
-    for concern in state["concerns"]:
-        if concern["id"] == concern_id:
-            if addressed_by not in concern["addressed_by"]:
-                concern["addressed_by"].append(addressed_by)
-            _save_state(task_dir, state)
-            return {
-                "success": True,
-                "concern": concern,
-                "task_id": state.get("task_id")
-            }
+    addressed = concern.setdefault("addressed_by", [])
+    if addressed_by not in addressed:
+        addressed.append(addressed_by)
+        _save_state(task_dir, state)
 
     return {
-        "success": False,
-        "error": f"Concern {concern_id} not found"
+        "success": True,
+        "concern": concern,
+        "task_id": state.get("task_id")
     }
 
 
@@ -1066,15 +1343,20 @@ def workflow_get_concerns(
         }
 
     state = _load_state(task_dir)
-    concerns = state.get("concerns", [])
 
-    if unaddressed_only:
-        concerns = [c for c in concerns if not c.get("addressed_by")]
+    # Single pass: filter and count unaddressed concerns together
+    concerns = []
+    unaddressed_count = 0
+    for c in state.get("concerns", []):
+        is_unaddressed = not c.get("addressed_by")
+        unaddressed_count += is_unaddressed
+        if is_unaddressed or not unaddressed_only:
+            concerns.append(c)
 
     return {
         "concerns": concerns,
         "total": len(concerns),
-        "unaddressed_count": len([c for c in state.get("concerns", []) if not c.get("addressed_by")]),
+        "unaddressed_count": unaddressed_count,
         "task_id": state.get("task_id")
     }
 
@@ -1108,8 +1390,8 @@ def workflow_save_discovery(
     }
 
     discoveries_file = memory_dir / "discoveries.jsonl"
-    with open(discoveries_file, "a") as f:
-        f.write(json.dumps(discovery) + "\n")
+    with open(discoveries_file, "ab") as f:
+        f.write(_dump_json_line(discovery))
 
     return {
         "success": True,
@@ -1142,19 +1424,9 @@ def workflow_get_discoveries(
             "task_id": task_dir.name
         }
 
-    discoveries = []
-    with open(discoveries_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                if category is None or entry.get("category") == category:
-                    discoveries.append(entry)
-            except json.JSONDecodeError:
-                # Skip malformed lines
-                continue
+    discoveries = _read_jsonl(discoveries_file)
+    if category is not None:
+        discoveries = [entry for entry in discoveries if entry.get("category") == category]
 
     return {
         "discoveries": discoveries,
@@ -1182,32 +1454,43 @@ def workflow_flush_context(
             "task_id": task_dir.name
         }
 
-    discoveries = []
-    by_category: dict[str, list] = {}
-
-    with open(discoveries_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                discoveries.append(entry)
-                cat = entry.get("category", "unknown")
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(entry)
-            except json.JSONDecodeError:
-                continue
+    discoveries = _read_jsonl(discoveries_file)
+    by_category = Counter(entry.get("category", "unknown") for entry in discoveries)
 
     return {
         "discoveries": discoveries,
         "count": len(discoveries),
-        "by_category": {cat: len(items) for cat, items in by_category.items()},
+        "by_category": dict(by_category),
         "task_id": task_dir.name
     }
 
 
+# Subdirectories that never contribute to an agent's context
+_CONTEXT_SKIP_DIRS = frozenset({"pruned", ".git", "__pycache__", "node_modules", ".venv"})
+
+
+def _iter_context_files(root: str, prefix: str = ""):
+    """Yield (relative_path, stat_result) for files under root.
+
+    Uses os.scandir so each entry is stat'ed once, and does not descend
+    into ``_CONTEXT_SKIP_DIRS`` (pruned summaries, VCS and env dirs).
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        rel_path = f"{prefix}{entry.name}"
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _CONTEXT_SKIP_DIRS:
+                    yield from _iter_context_files(entry.path, rel_path + os.sep)
+            elif entry.is_file():
+                yield rel_path, entry.stat()
+        except OSError:
+            continue
+
+
 def workflow_get_context_usage(
     task_id: Optional[str] = None
 ) -> dict[str, Any]:
@@ -1230,23 +1513,18 @@ def workflow_get_context_usage(
     total_tokens_estimate = 0
 
     # Scan task directory for relevant files
-    for file_path in task_dir.rglob("*"):
-        if file_path.is_file():
-            try:
-                size = file_path.stat().st_size
-                total_size_bytes += size
-                tokens_estimate = size // CHARS_PER_TOKEN
-                total_tokens_estimate += tokens_estimate
-
-                rel_path = file_path.relative_to(task_dir)
-                files_info.append({
-                    "path": str(rel_path),
-                    "size_bytes": size,
-                    "tokens_estimate": tokens_estimate,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                })
-            except (OSError, IOError):
-                continue
+    for rel_path, st in _iter_context_files(str(task_dir)):
+        size = st.st_size
+        total_size_bytes += size
+        tokens_estimate = size // CHARS_PER_TOKEN
+        total_tokens_estimate += tokens_estimate
+
+        files_info.append({
+            "path": rel_path,
+            "size_bytes": size,
+            "tokens_estimate": tokens_estimate,
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+        })
 
     # Sort by size descending to show largest files first
     files_info.sort(key=lambda x: x["size_bytes"], reverse=True)
@@ -1280,13 +1558,96 @@ def _get_context_recommendation(usage_percent: float) -> str:
         return "Context usage is critical. Prune aggressively and save all important discoveries before compaction."
 
 
+# Files that are safe to prune (verbose outputs)
+PRUNABLE_PATTERNS = [
+    "repomix-output.txt",
+    "gemini-analysis.md",
+    "*.log",
+]
+
+# Files that should never be pruned
+PRESERVE_PATTERNS = [
+    "state.json",
+    "plan.md",
+    "config.yaml",
+    "task.md",
+    "architect.md",
+    "developer.md",
+    "reviewer.md",
+    "skeptic.md",
+]
+
+
+def _split_patterns(patterns: list[str]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Split ``*suffix`` globs from exact names so matching is a set lookup + endswith."""
+    exact = frozenset(p for p in patterns if not p.startswith("*"))
+    suffixes = tuple(p[1:] for p in patterns if p.startswith("*"))
+    return exact, suffixes
+
+
+_PRUNABLE_EXACT, _PRUNABLE_SUFFIXES = _split_patterns(PRUNABLE_PATTERNS)
+_PRESERVE_EXACT, _PRESERVE_SUFFIXES = _split_patterns(PRESERVE_PATTERNS)
+
+
+# Lines of head/tail context kept in a pruned file's summary
+_PRUNE_CONTEXT_LINES = 10
+_PRUNE_READ_BLOCK = 8192
+
+
+def _summarize_text_file(file_path: Path) -> dict[str, Any]:
+    """Capture head/tail context of a text file without reading it into memory.
+
+    Lines are counted block-by-block, then only the first and last
+    ``_PRUNE_CONTEXT_LINES`` lines are read (the tail via a backwards seek).
+    Files short enough to be kept whole are returned as ``content``.
+    """
+    n = _PRUNE_CONTEXT_LINES
+    with open(file_path, "rb") as f:
+        newlines = 0
+        last = b""
+        for block in iter(lambda: f.read(64 * 1024), b""):
+            newlines += block.count(b"\n")
+            last = block[-1:]
+        total_lines = newlines + (1 if last and last != b"\n" else 0)
+
+        f.seek(0)
+        if total_lines <= 2 * n:
+            return {"content": f.read().decode("utf-8", errors="ignore")}
+
+        head = b""
+        while head.count(b"\n") < n:
+            block = f.read(_PRUNE_READ_BLOCK)
+            if not block:
+                break
+            head += block
+        head = b"".join(head.splitlines(keepends=True)[:n])
+
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        tail = b""
+        # One extra newline is needed to find the start of the first tail line
+        while pos > 0 and tail.rstrip(b"\n").count(b"\n") < n:
+            step = min(_PRUNE_READ_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+        tail = b"".join(tail.splitlines(keepends=True)[-n:])
+
+    return {
+        "head": head.decode("utf-8", errors="ignore"),
+        "tail": tail.decode("utf-8", errors="ignore"),
+        "total_lines": total_lines,
+    }
+
+
 def workflow_prune_old_outputs(
     keep_last_n: int = 5,
     task_id: Optional[str] = None
 ) -> dict[str, Any]:
     """Prune old tool outputs to reduce context pressure.
 
-    Creates summaries of pruned content and stores them, allowing context
+    Creates summaries of pruned content and appends them to
+    ``pruned/summaries.jsonl`` (one JSON object per line), allowing context
     to be reduced while preserving key information about what was done.
 
     Args:
@@ -1311,25 +1672,6 @@ def workflow_prune_old_outputs(
     preserved_files = []
     bytes_saved = 0
 
-    # Define files that are safe to prune (verbose outputs)
-    PRUNABLE_PATTERNS = [
-        "repomix-output.txt",
-        "gemini-analysis.md",
-        "*.log",
-    ]
-
-    # Define files that should never be pruned
-    PRESERVE_PATTERNS = [
-        "state.json",
-        "plan.md",
-        "config.yaml",
-        "task.md",
-        "architect.md",
-        "developer.md",
-        "reviewer.md",
-        "skeptic.md",
-    ]
-
     # Get all files sorted by modification time (oldest first)
     all_files = []
     for file_path in task_dir.iterdir():
@@ -1344,20 +1686,12 @@ def workflow_prune_old_outputs(
         name = file_path.name
 
         # Check if should be preserved
-        should_preserve = any(
-            name == pattern or (pattern.startswith("*") and name.endswith(pattern[1:]))
-            for pattern in PRESERVE_PATTERNS
-        )
-
-        if should_preserve:
+        if name in _PRESERVE_EXACT or name.endswith(_PRESERVE_SUFFIXES):
             preserved_files.append(name)
             continue
 
         # Check if prunable
-        is_prunable = any(
-            name == pattern or (pattern.startswith("*") and name.endswith(pattern[1:]))
-            for pattern in PRUNABLE_PATTERNS
-        )
+        is_prunable = name in _PRUNABLE_EXACT or name.endswith(_PRUNABLE_SUFFIXES)
 
         # Also prune large files (>50KB) that aren't in preserve list
         if is_prunable or file_path.stat().st_size > 50 * 1024:
@@ -1372,6 +1706,9 @@ def workflow_prune_old_outputs(
     else:
         files_to_prune = []
 
+    # Build all summaries first, then append them to summaries.jsonl in one write
+    summaries = []
+    pruned_at = datetime.now().isoformat()
     for file_path in files_to_prune:
         try:
             original_size = file_path.stat().st_size
@@ -1380,44 +1717,47 @@ def workflow_prune_old_outputs(
             summary = {
                 "original_file": file_path.name,
                 "original_size_bytes": original_size,
-                "pruned_at": datetime.now().isoformat(),
+                "pruned_at": pruned_at,
                 "summary": f"Pruned {file_path.name} ({original_size} bytes)"
             }
 
             # For text files, keep first and last few lines as context
             if file_path.suffix in [".txt", ".md", ".log", ".json", ".jsonl"]:
                 try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = f.readlines()
-
-                    if len(lines) > 20:
-                        summary["head"] = "".join(lines[:10])
-                        summary["tail"] = "".join(lines[-10:])
-                        summary["total_lines"] = len(lines)
-                    else:
-                        summary["content"] = "".join(lines)
+                    summary.update(_summarize_text_file(file_path))
                 except Exception:
                     pass
 
-            # Save summary
-            summary_file = pruned_dir / f"{file_path.stem}_summary.json"
-            with open(summary_file, "w") as f:
-                json.dump(summary, f, indent=2)
+            summaries.append((file_path, original_size, summary))
+        except Exception:
+            # Skip files that can't be pruned
+            continue
 
-            # Remove original file
-            file_path.unlink()
+    summaries_file = pruned_dir / "summaries.jsonl"
+    if summaries:
+        records = [_dump_json_line(summary) for _, _, summary in summaries]
+        with open(summaries_file, "ab") as f:
+            # Append mode starts at end of file: the first new record's offset
+            offset = f.tell()
+            f.write(b"".join(records))
+
+        for (file_path, original_size, _), record in zip(summaries, records):
+            record_offset = offset
+            offset += len(record)
+            try:
+                # Remove original file
+                file_path.unlink()
+            except OSError:
+                continue
 
             bytes_saved += original_size
             pruned_files.append({
                 "file": file_path.name,
                 "size_bytes": original_size,
-                "summary_at": str(summary_file.relative_to(task_dir))
+                "summary_at": str(summaries_file.relative_to(task_dir)),
+                "summary_offset": record_offset
             })
 
-        except Exception as e:
-            # Skip files that can't be pruned
-            continue
-
     return {
         "success": True,
         "task_id": task_dir.name,
@@ -1473,12 +1813,13 @@ def workflow_search_memories(
                 search_dirs.append(task_dir)
     else:
         # Search all tasks
-        search_dirs = [d for d in tasks_dir.iterdir() if d.is_dir()]
+        search_dirs = _list_task_dirs(tasks_dir)
 
     results = []
     tasks_searched = 0
     query_lower = query.lower()
     query_words = query_lower.split()
+    query_words_bytes = [word.encode("utf-8") for word in query_words]
 
     for task_dir in search_dirs:
         discoveries_file = task_dir / "memory" / "discoveries.jsonl"
@@ -1487,13 +1828,21 @@ def workflow_search_memories(
 
         tasks_searched += 1
 
-        with open(discoveries_file, "r") as f:
+        with open(discoveries_file, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
+                # Without escapes every JSON string appears verbatim in the
+                # raw line, so a line with no query word can't match: skip
+                # decoding it. bytes.lower() only folds ASCII, so lines with
+                # other characters are always decoded.
+                if b"\\" not in line and line.isascii():
+                    line_lower = line.lower()
+                    if not any(word in line_lower for word in query_words_bytes):
+                        continue
                 try:
-                    entry = json.loads(line)
+                    entry = _parse_json_bytes(line)
 
                     # Category filter
                     if category and entry.get("category") != category:
@@ -1511,7 +1860,7 @@ def workflow_search_memories(
                             "timestamp": entry.get("timestamp"),
                             "relevance": matches / len(query_words)  # 0-1 score
                         })
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
 
     # Sort by relevance (highest first), then by timestamp (newest first)
@@ -1564,10 +1913,12 @@ def workflow_link_tasks(
     # Verify all related tasks exist
     valid_related = []
     invalid_related = []
+    related_dirs: dict[str, Path] = {}
     for related_id in related_task_ids:
         related_dir = find_task_dir(related_id)
         if related_dir:
             valid_related.append(related_dir.name)
+            related_dirs[related_dir.name] = related_dir
         else:
             invalid_related.append(related_id)
 
@@ -1580,19 +1931,18 @@ def workflow_link_tasks(
     # Load current state
     state = _load_state(task_dir)
 
-    # Initialize links structure if needed
-    if "linked_tasks" not in state:
-        state["linked_tasks"] = {}
-
-    if relationship not in state["linked_tasks"]:
-        state["linked_tasks"][relationship] = []
-
     # Add new links (avoid duplicates)
-    existing = set(state["linked_tasks"][relationship])
-    new_links = [t for t in valid_related if t not in existing]
-    state["linked_tasks"][relationship].extend(new_links)
-
-    _save_state(task_dir, state)
+    links = state.setdefault("linked_tasks", {}).setdefault(relationship, [])
+    existing = set(links)
+    new_links = []
+    for t in valid_related:
+        if t not in existing:
+            existing.add(t)
+            new_links.append(t)
+
+    if new_links:
+        links.extend(new_links)
+        _save_state(task_dir, state)
 
     # Create reverse links for bidirectional relationships
     reverse_relationship = {
@@ -1603,15 +1953,12 @@ def workflow_link_tasks(
     }.get(relationship, "related")
 
     for related_id in new_links:
-        related_dir = find_task_dir(related_id)
-        if related_dir:
-            related_state = _load_state(related_dir)
-            if "linked_tasks" not in related_state:
-                related_state["linked_tasks"] = {}
-            if reverse_relationship not in related_state["linked_tasks"]:
-                related_state["linked_tasks"][reverse_relationship] = []
-            if task_dir.name not in related_state["linked_tasks"][reverse_relationship]:
-                related_state["linked_tasks"][reverse_relationship].append(task_dir.name)
+        related_dir = related_dirs[related_id]
+        related_state = _load_state(related_dir)
+        reverse_links = related_state.setdefault("linked_tasks", {}).setdefault(reverse_relationship, [])
+        # Only rewrite the related task's state when the reverse link is new
+        if task_dir.name not in reverse_links:
+            reverse_links.append(task_dir.name)
             _save_state(related_dir, related_state)
 
     return {
@@ -1663,17 +2010,8 @@ def workflow_get_linked_tasks(
             if linked_dir:
                 discoveries_file = linked_dir / "memory" / "discoveries.jsonl"
                 if discoveries_file.exists():
-                    discoveries = []
-                    with open(discoveries_file, "r") as f:
-                        for line in f:
-                            line = line.strip()
-                            if line:
-                                try:
-                                    discoveries.append(json.loads(line))
-                                except json.JSONDecodeError:
-                                    continue
                     # Keep only last 10 discoveries per task
-                    linked_memories[linked_id] = discoveries[-10:]
+                    linked_memories[linked_id] = _read_jsonl(discoveries_file)[-10:]
 
         result["linked_memories"] = linked_memories
 
@@ -1700,6 +2038,10 @@ DEFAULT_RESILIENCE_CONFIG = {
     }
 }
 
+# Fallback chain snapshot taken once at import for the per-call lookups
+_FALLBACK_CHAIN = tuple(DEFAULT_RESILIENCE_CONFIG["fallback_chain"])
+_FALLBACK_MODEL_NAMES = tuple(m["model"] for m in _FALLBACK_CHAIN)
+
 # Error types that trigger different cooldown behaviors
 ERROR_TYPES = [
     "rate_limit",      # 429 - too many requests
@@ -1711,6 +2053,24 @@ ERROR_TYPES = [
     "unknown"          # Other errors
 ]
 
+# Per-model error history kept in the resilience state
+MAX_MODEL_ERRORS = 10
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file, then os.replace() it over path."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def _get_resilience_state_file() -> Path:
     """Get the path to the global resilience state file."""
@@ -1719,24 +2079,73 @@ def _get_resilience_state_file() -> Path:
     return tasks_dir / ".resilience_state.json"
 
 
+# Last seen resilience state bytes per file, keyed by _file_stat_key
+_resilience_cache: dict[Path, tuple[tuple[int, int, int], bytes]] = {}
+
+
 def _load_resilience_state() -> dict:
-    """Load the global resilience state."""
+    """Load the global resilience state.
+
+    While the file is unchanged since it was last read or written here,
+    the cached bytes are parsed instead of re-reading the file. Every
+    call returns a fresh dict that callers may mutate.
+    """
     state_file = _get_resilience_state_file()
-    if state_file.exists():
-        with open(state_file, "r") as f:
-            return json.load(f)
-    return {
-        "models": {},
-        "updated_at": datetime.now().isoformat()
-    }
+    key = _file_stat_key(state_file)
+    if key is None:
+        _resilience_cache.pop(state_file, None)
+        return {
+            "models": {},
+            "updated_at": datetime.now().isoformat()
+        }
+
+    cached = _resilience_cache.get(state_file)
+    if cached is not None and cached[0] == key:
+        return _parse_json_bytes(cached[1])
+
+    raw = state_file.read_bytes()
+    _resilience_cache[state_file] = (key, raw)
+    return _parse_json_bytes(raw)
 
 
 def _save_resilience_state(state: dict) -> None:
-    """Save the global resilience state."""
-    state["updated_at"] = datetime.now().isoformat()
+    """Save the global resilience state.
+
+    Written atomically so lock-free readers never observe a partial file.
+    The written bytes are cached, so the next load skips the read.
+    """
     state_file = _get_resilience_state_file()
-    with open(state_file, "w") as f:
-        json.dump(state, f, indent=2)
+    state["updated_at"] = datetime.now().isoformat()
+    raw = _dump_json_bytes(state)
+    try:
+        _write_bytes_atomic(state_file, raw)
+    except BaseException:
+        _resilience_cache.pop(state_file, None)
+        raise
+    key = _file_stat_key(state_file)
+    if key is not None:
+        _resilience_cache[state_file] = (key, raw)
+
+
+def _cooldown_remaining(model_state: dict, now_ts: float) -> float:
+    """Seconds left in a model's cooldown (<= 0 when not in cooldown).
+
+    Reads the precomputed cooldown_until_epoch, back-filling it from the
+    ISO cooldown_until for state files written before the field existed.
+    """
+    epoch = model_state.get("cooldown_until_epoch")
+    if epoch is None:
+        cooldown_until = model_state.get("cooldown_until")
+        if not cooldown_until:
+            return 0
+        epoch = datetime.fromisoformat(cooldown_until).timestamp()
+        model_state["cooldown_until_epoch"] = epoch
+    return epoch - now_ts
+
+
+def _resilience_lock() -> FileLock:
+    """Lock serializing read-modify-write cycles on the resilience state."""
+    return FileLock(str(_get_resilience_state_file()) + ".lock")
 
 
 def workflow_record_model_error(
@@ -1765,64 +2174,69 @@ def workflow_record_model_error(
             "error": f"Invalid error_type '{error_type}'. Must be one of: {', '.join(ERROR_TYPES)}"
         }
 
-    state = _load_resilience_state()
-    now = datetime.now()
-
-    # Initialize model state if needed
-    if model not in state["models"]:
-        state["models"][model] = {
-            "error_count": 0,
-            "consecutive_errors": 0,
-            "last_error": None,
-            "last_error_type": None,
-            "cooldown_until": None,
-            "errors": []
-        }
-
-    model_state = state["models"][model]
-
-    # Update error counts
-    model_state["error_count"] += 1
-    model_state["consecutive_errors"] += 1
-    model_state["last_error"] = now.isoformat()
-    model_state["last_error_type"] = error_type
+    with _resilience_lock():
+        state = _load_resilience_state()
+        now = datetime.now()
+        now_iso = now.isoformat()
+
+        # Initialize model state if needed
+        if model not in state["models"]:
+            state["models"][model] = {
+                "error_count": 0,
+                "consecutive_errors": 0,
+                "last_error": None,
+                "last_error_type": None,
+                "cooldown_until": None,
+                "errors": []
+            }
 
-    # Keep last 10 errors for debugging
-    model_state["errors"].append({
-        "type": error_type,
-        "message": error_message[:200] if error_message else "",
-        "timestamp": now.isoformat(),
-        "task_id": task_id
-    })
-    model_state["errors"] = model_state["errors"][-10:]
-
-    # Calculate cooldown based on error type and consecutive errors
-    config = DEFAULT_RESILIENCE_CONFIG["cooldown"]
-    consecutive = model_state["consecutive_errors"]
-
-    if error_type == "rate_limit":
-        # Exponential backoff: 1m, 5m, 25m, capped at max
-        backoff_idx = min(consecutive - 1, len(DEFAULT_RESILIENCE_CONFIG["retry"]["backoff_seconds"]) - 1)
-        cooldown_seconds = DEFAULT_RESILIENCE_CONFIG["retry"]["backoff_seconds"][backoff_idx]
-    elif error_type == "billing":
-        # Billing errors get longer cooldown
-        cooldown_seconds = config["billing_seconds"]
-    elif error_type == "overloaded":
-        # Overloaded: start at 1m, increase with consecutive errors
-        cooldown_seconds = min(60 * consecutive, config["max_cooldown_seconds"])
-    elif error_type in ["timeout", "server_error"]:
-        # Server issues: moderate backoff
-        cooldown_seconds = min(config["error_seconds"] * consecutive, config["max_cooldown_seconds"])
-    elif error_type == "auth":
-        # Auth errors: don't retry quickly
-        cooldown_seconds = config["max_cooldown_seconds"]
-    else:
-        cooldown_seconds = config["error_seconds"]
+        model_state = state["models"][model]
+
+        # Update error counts
+        model_state["error_count"] += 1
+        model_state["consecutive_errors"] += 1
+        model_state["last_error"] = now_iso
+        model_state["last_error_type"] = error_type
+
+        # Keep last few errors for debugging (trimmed in place, no list copy)
+        errors = model_state["errors"]
+        errors.append({
+            "type": error_type,
+            "message": error_message[:200] if error_message else "",
+            "timestamp": now_iso,
+            "task_id": task_id
+        })
+        if len(errors) > MAX_MODEL_ERRORS:
+            del errors[:-MAX_MODEL_ERRORS]
+
+        # Calculate cooldown based on error type and consecutive errors
+        config = DEFAULT_RESILIENCE_CONFIG["cooldown"]
+        consecutive = model_state["consecutive_errors"]
+
+        if error_type == "rate_limit":
+            # Exponential backoff: 1m, 5m, 25m, capped at max
+            backoff_idx = min(consecutive - 1, len(DEFAULT_RESILIENCE_CONFIG["retry"]["backoff_seconds"]) - 1)
+            cooldown_seconds = DEFAULT_RESILIENCE_CONFIG["retry"]["backoff_seconds"][backoff_idx]
+        elif error_type == "billing":
+            # Billing errors get longer cooldown
+            cooldown_seconds = config["billing_seconds"]
+        elif error_type == "overloaded":
+            # Overloaded: start at 1m, increase with consecutive errors
+            cooldown_seconds = min(60 * consecutive, config["max_cooldown_seconds"])
+        elif error_type in ["timeout", "server_error"]:
+            # Server issues: moderate backoff
+            cooldown_seconds = min(config["error_seconds"] * consecutive, config["max_cooldown_seconds"])
+        elif error_type == "auth":
+            # Auth errors: don't retry quickly
+            cooldown_seconds = config["max_cooldown_seconds"]
+        else:
+            cooldown_seconds = config["error_seconds"]
 
-    cooldown_until = now.timestamp() + cooldown_seconds
-    model_state["cooldown_until"] = datetime.fromtimestamp(cooldown_until).isoformat()
+        cooldown_until = now.timestamp() + cooldown_seconds
+        model_state["cooldown_until"] = datetime.fromtimestamp(cooldown_until).isoformat()
+        model_state["cooldown_until_epoch"] = cooldown_until
 
-    _save_resilience_state(state)
+        _save_resilience_state(state)
 
     return {
         "success": True,
@@ -1848,21 +2262,23 @@ def workflow_record_model_success(
     Returns:
         Updated model state
     """
-    state = _load_resilience_state()
+    with _resilience_lock():
+        state = _load_resilience_state()
 
-    if model not in state["models"]:
-        return {
-            "success": True,
-            "model": model,
-            "message": "No error history for this model"
-        }
+        if model not in state["models"]:
+            return {
+                "success": True,
+                "model": model,
+                "message": "No error history for this model"
+            }
 
-    model_state = state["models"][model]
-    model_state["consecutive_errors"] = 0
-    model_state["cooldown_until"] = None
-    model_state["last_success"] = datetime.now().isoformat()
+        model_state = state["models"][model]
+        model_state["consecutive_errors"] = 0
+        model_state["cooldown_until"] = None
+        model_state["cooldown_until_epoch"] = None
+        model_state["last_success"] = datetime.now().isoformat()
 
-    _save_resilience_state(state)
+        _save_resilience_state(state)
 
     return {
         "success": True,
@@ -1873,66 +2289,79 @@ def workflow_record_model_success(
 
 
 def workflow_get_available_model(
-    preferred_model: Optional[str] = None
+    preferred_model: Optional[str] = None,
+    include_diagnostics: bool = True
 ) -> dict[str, Any]:
     """Get the next available model considering cooldowns.
 
     Checks the fallback chain and returns the first model not in cooldown.
     Use this before making API calls to get a working model.
 
+    By default every model is checked and reported in checked_models.
+    With include_diagnostics=False the sweep stops at the first available
+    model and checked_models is empty.
+
     Args:
         preferred_model: Optional preferred model to try first
+        include_diagnostics: If false, skip the per-model report in checked_models
 
     Returns:
         Available model and fallback information
     """
     state = _load_resilience_state()
-    now = datetime.now()
-    fallback_chain = DEFAULT_RESILIENCE_CONFIG["fallback_chain"]
+    now_ts = time.time()
+    fallback_chain = _FALLBACK_CHAIN
+    models = state["models"]
 
-    # Build ordered list of models to try
-    models_to_try = []
-    if preferred_model:
-        models_to_try.append({"model": preferred_model, "timeout": 120})
-    models_to_try.extend(fallback_chain)
+    # Fast path: first choice is not in cooldown
+    first = {"model": preferred_model, "timeout": 120} if preferred_model else fallback_chain[0]
+    if not include_diagnostics and _cooldown_remaining(models.get(first["model"], {}), now_ts) <= 0:
+        return {
+            "available": True,
+            "model": first["model"],
+            "timeout": first["timeout"],
+            "is_fallback": False,
+            "checked_models": []
+        }
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_models = []
-    for m in models_to_try:
-        if m["model"] not in seen:
-            seen.add(m["model"])
-            unique_models.append(m)
+    # Ordered, de-duplicated models to try (dicts keep insertion order)
+    by_name = {}
+    if preferred_model:
+        by_name[preferred_model] = {"model": preferred_model, "timeout": 120}
+    for m in fallback_chain:
+        by_name.setdefault(m["model"], m)
 
     available_model = None
     checked_models = []
+    shortest_model = None
+    shortest_seconds = None
+
+    for model, model_config in by_name.items():
+        model_state = models.get(model, {})
+
+        remaining = _cooldown_remaining(model_state, now_ts)
+        in_cooldown = remaining > 0
+        remaining_seconds = int(remaining) if in_cooldown else 0
+
+        if include_diagnostics:
+            checked_models.append({
+                "model": model,
+                "available": not in_cooldown,
+                "in_cooldown": in_cooldown,
+                "cooldown_remaining_seconds": remaining_seconds,
+                "consecutive_errors": model_state.get("consecutive_errors", 0),
+                "last_error_type": model_state.get("last_error_type"),
+                "timeout": model_config["timeout"]
+            })
 
-    for model_config in unique_models:
-        model = model_config["model"]
-        model_state = state["models"].get(model, {})
-
-        cooldown_until = model_state.get("cooldown_until")
-        in_cooldown = False
-        remaining_seconds = 0
-
-        if cooldown_until:
-            cooldown_time = datetime.fromisoformat(cooldown_until)
-            if now < cooldown_time:
-                in_cooldown = True
-                remaining_seconds = int((cooldown_time - now).total_seconds())
-
-        checked_models.append({
-            "model": model,
-            "available": not in_cooldown,
-            "in_cooldown": in_cooldown,
-            "cooldown_remaining_seconds": remaining_seconds if in_cooldown else 0,
-            "consecutive_errors": model_state.get("consecutive_errors", 0),
-            "last_error_type": model_state.get("last_error_type"),
-            "timeout": model_config["timeout"]
-        })
-
-        if not in_cooldown and available_model is None:
-            available_model = model_config
+        if not in_cooldown:
+            if available_model is None:
+                available_model = model_config
+            if not include_diagnostics:
+                break
+        elif shortest_seconds is None or remaining_seconds < shortest_seconds:
+            shortest_model = model
+            shortest_seconds = remaining_seconds
 
     if available_model:
         return {
@@ -1944,17 +2373,34 @@ def workflow_get_available_model(
         }
     else:
         # All models in cooldown - return the one with shortest remaining cooldown
-        shortest_cooldown = min(checked_models, key=lambda x: x["cooldown_remaining_seconds"])
         return {
             "available": False,
             "model": None,
-            "wait_seconds": shortest_cooldown["cooldown_remaining_seconds"],
-            "next_available": shortest_cooldown["model"],
-            "message": f"All models in cooldown. {shortest_cooldown['model']} available in {shortest_cooldown['cooldown_remaining_seconds']}s",
+            "wait_seconds": shortest_seconds,
+            "next_available": shortest_model,
+            "message": f"All models in cooldown. {shortest_model} available in {shortest_seconds}s",
             "checked_models": checked_models
         }
 
 
+def _model_status(model: str, model_state: dict, now_ts: float) -> dict[str, Any]:
+    """Health summary for one model in workflow_get_resilience_status."""
+    get = model_state.get
+    remaining = _cooldown_remaining(model_state, now_ts)
+    in_cooldown = remaining > 0
+    return {
+        "model": model,
+        "total_errors": get("error_count", 0),
+        "consecutive_errors": get("consecutive_errors", 0),
+        "in_cooldown": in_cooldown,
+        "cooldown_remaining_seconds": int(remaining) if in_cooldown else 0,
+        "last_error_type": get("last_error_type"),
+        "last_error": get("last_error"),
+        "last_success": get("last_success"),
+        "recent_errors": get("errors", [])[-5:]
+    }
+
+
 def workflow_get_resilience_status() -> dict[str, Any]:
     """Get the current resilience status for all models.
 
@@ -1965,35 +2411,16 @@ def workflow_get_resilience_status() -> dict[str, Any]:
         Complete resilience state
     """
     state = _load_resilience_state()
-    now = datetime.now()
+    now_ts = time.time()
 
-    models_status = []
-    for model, model_state in state.get("models", {}).items():
-        cooldown_until = model_state.get("cooldown_until")
-        in_cooldown = False
-        remaining_seconds = 0
-
-        if cooldown_until:
-            cooldown_time = datetime.fromisoformat(cooldown_until)
-            if now < cooldown_time:
-                in_cooldown = True
-                remaining_seconds = int((cooldown_time - now).total_seconds())
-
-        models_status.append({
-            "model": model,
-            "total_errors": model_state.get("error_count", 0),
-            "consecutive_errors": model_state.get("consecutive_errors", 0),
-            "in_cooldown": in_cooldown,
-            "cooldown_remaining_seconds": remaining_seconds,
-            "last_error_type": model_state.get("last_error_type"),
-            "last_error": model_state.get("last_error"),
-            "last_success": model_state.get("last_success"),
-            "recent_errors": model_state.get("errors", [])[-5:]
-        })
+    models_status = [
+        _model_status(model, model_state, now_ts)
+        for model, model_state in state.get("models", {}).items()
+    ]
 
     return {
         "models": models_status,
-        "fallback_chain": [m["model"] for m in DEFAULT_RESILIENCE_CONFIG["fallback_chain"]],
+        "fallback_chain": list(_FALLBACK_MODEL_NAMES),
         "config": DEFAULT_RESILIENCE_CONFIG,
         "updated_at": state.get("updated_at")
     }
@@ -2012,20 +2439,22 @@ def workflow_clear_model_cooldown(
     Returns:
         Updated model state
     """
-    state = _load_resilience_state()
-
-    if model not in state["models"]:
-        return {
-            "success": True,
-            "model": model,
-            "message": "No state to clear for this model"
-        }
+    with _resilience_lock():
+        state = _load_resilience_state()
 
-    model_state = state["models"][model]
-    model_state["cooldown_until"] = None
-    model_state["consecutive_errors"] = 0
+        if model not in state["models"]:
+            return {
+                "success": True,
+                "model": model,
+                "message": "No state to clear for this model"
+            }
 
-    _save_resilience_state(state)
+        model_state = state["models"][model]
+        if model_state.get("cooldown_until") or model_state.get("consecutive_errors"):
+            model_state["cooldown_until"] = None
+            model_state["cooldown_until_epoch"] = None
+            model_state["consecutive_errors"] = 0
+            _save_resilience_state(state)
 
     return {
         "success": True,
@@ -2091,26 +2520,94 @@ EFFORT_LEVELS = {
     }
 }
 
-# Keywords for auto-detection
-AUTO_DETECT_RULES = {
-    "minimal": {
-        "keywords": ["typo", "fix typo", "simple fix", "rename", "update comment", "fix import"],
-        "max_files": 1
-    },
-    "turbo": {
-        "keywords": ["add feature", "implement", "update", "refactor", "add", "create", "build", "utility"],
-        "exclude_keywords": ["security", "auth", "database", "migration", "api", "breaking",
-                           "authentication", "authorization", "password", "token", "critical"]
-    },
-    "fast": {
-        "keywords": ["add feature", "implement", "update", "refactor"],
-        "exclude_keywords": ["security", "auth", "database", "migration", "api", "breaking"]
-    },
-    "full": {
-        "keywords": ["security", "authentication", "authorization", "database", "migration",
-                    "api", "breaking change", "critical", "auth", "password", "token"]
-    }
-}
+# Keywords for auto-detection
+AUTO_DETECT_RULES = {
+    "minimal": {
+        "keywords": ["typo", "fix typo", "simple fix", "rename", "update comment", "fix import"],
+        "max_files": 1
+    },
+    "turbo": {
+        "keywords": ["add feature", "implement", "update", "refactor", "add", "create", "build", "utility"],
+        "exclude_keywords": ["security", "auth", "database", "migration", "api", "breaking",
+                           "authentication", "authorization", "password", "token", "critical"]
+    },
+    "fast": {
+        "keywords": ["add feature", "implement", "update", "refactor"],
+        "exclude_keywords": ["security", "auth", "database", "migration", "api", "breaking"]
+    },
+    "full": {
+        "keywords": ["security", "authentication", "authorization", "database", "migration",
+                    "api", "breaking change", "critical", "auth", "password", "token"]
+    }
+}
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile keywords into one alternation matching any of them as a substring."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# One regex sweep per keyword list; the per-keyword scan only runs on a hit
+_FULL_RE = _keyword_pattern(AUTO_DETECT_RULES["full"]["keywords"])
+_MINIMAL_RE = _keyword_pattern(AUTO_DETECT_RULES["minimal"]["keywords"])
+_TURBO_RE = _keyword_pattern(AUTO_DETECT_RULES["turbo"]["keywords"])
+_TURBO_EXCLUDE_RE = _keyword_pattern(AUTO_DETECT_RULES["turbo"]["exclude_keywords"])
+_FAST_RE = _keyword_pattern(AUTO_DETECT_RULES["fast"]["keywords"])
+_FAST_EXCLUDE_RE = _keyword_pattern(AUTO_DETECT_RULES["fast"]["exclude_keywords"])
+
+
+def _matched_keywords(pattern: re.Pattern, keywords: list[str], text: str) -> list[str]:
+    """Keywords found in text, in rule order; empty without scanning on a miss."""
+    if not pattern.search(text):
+        return []
+    return [k for k in keywords if k in text]
+
+
+_HARDCODED_MODE_NAMES = tuple(WORKFLOW_MODES)
+
+# Merged config per task_id, keyed by the mtimes of the config files it came from
+_effective_config_cache: dict[Optional[str], tuple[tuple, dict]] = {}
+
+
+def _get_effective_config(task_id: Optional[str] = None) -> dict:
+    """Return the merged workflow config for a task. Callers must not mutate it.
+
+    The merged config is only re-read when one of the global, project or
+    task config files has changed since the last lookup for this task.
+    """
+    from .config_tools import (
+        config_get_effective,
+        _get_global_config_path,
+        _get_project_config_path,
+        _get_task_config_path,
+    )
+    paths = [_get_global_config_path(), _get_project_config_path()]
+    if task_id:
+        paths.append(_get_task_config_path(task_id))
+    fingerprint = []
+    for path in paths:
+        try:
+            fingerprint.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            fingerprint.append((str(path), None))
+    fingerprint = tuple(fingerprint)
+
+    cached = _effective_config_cache.get(task_id)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    config = config_get_effective(task_id=task_id).get("config", {})
+    _effective_config_cache[task_id] = (fingerprint, config)
+    return config
+
+
+def _get_custom_modes(task_id: Optional[str] = None) -> dict:
+    """Get config-defined workflow modes (workflow_modes.modes)."""
+    try:
+        config = _get_effective_config(task_id)
+        return config.get("workflow_modes", {}).get("modes", {}) or {}
+    except Exception:
+        return {}
 
 
 def _resolve_mode(mode_name: str, task_id: Optional[str] = None) -> Optional[dict]:
@@ -2131,17 +2628,7 @@ def _resolve_mode(mode_name: str, task_id: Optional[str] = None) -> Optional[dic
         return WORKFLOW_MODES[mode_name]
 
     # Check config for custom modes
-    try:
-        from .config_tools import config_get_effective
-        effective = config_get_effective(task_id=task_id)
-        config = effective.get("config", {})
-        custom_modes = config.get("workflow_modes", {}).get("modes", {})
-        if mode_name in custom_modes:
-            return custom_modes[mode_name]
-    except Exception:
-        pass
-
-    return None
+    return _get_custom_modes(task_id).get(mode_name)
 
 
 def _get_all_mode_names(task_id: Optional[str] = None) -> list[str]:
@@ -2153,17 +2640,10 @@ def _get_all_mode_names(task_id: Optional[str] = None) -> list[str]:
     Returns:
         List of all known mode names
     """
-    modes = list(WORKFLOW_MODES.keys())
-    try:
-        from .config_tools import config_get_effective
-        effective = config_get_effective(task_id=task_id)
-        config = effective.get("config", {})
-        custom_modes = config.get("workflow_modes", {}).get("modes", {})
-        for name in custom_modes:
-            if name not in modes:
-                modes.append(name)
-    except Exception:
-        pass
+    modes = list(_HARDCODED_MODE_NAMES)
+    for name in _get_custom_modes(task_id):
+        if name not in WORKFLOW_MODES:
+            modes.append(name)
     return modes
 
 
@@ -2187,10 +2667,7 @@ def workflow_detect_mode(
     file_count = len(files_affected) if files_affected else 0
 
     # Check for full mode triggers first (highest priority)
-    full_matches = []
-    for keyword in AUTO_DETECT_RULES["full"]["keywords"]:
-        if keyword in desc_lower:
-            full_matches.append(keyword)
+    full_matches = _matched_keywords(_FULL_RE, AUTO_DETECT_RULES["full"]["keywords"], desc_lower)
 
     if full_matches:
         return {
@@ -2201,10 +2678,7 @@ def workflow_detect_mode(
         }
 
     # Check for minimal mode
-    minimal_matches = []
-    for keyword in AUTO_DETECT_RULES["minimal"]["keywords"]:
-        if keyword in desc_lower:
-            minimal_matches.append(keyword)
+    minimal_matches = _matched_keywords(_MINIMAL_RE, AUTO_DETECT_RULES["minimal"]["keywords"], desc_lower)
 
     if minimal_matches and file_count <= AUTO_DETECT_RULES["minimal"]["max_files"]:
         return {
@@ -2215,17 +2689,8 @@ def workflow_detect_mode(
         }
 
     # Check for turbo mode (Opus 4.6 single-pass planning)
-    turbo_excluded = False
-    for exclude_keyword in AUTO_DETECT_RULES["turbo"]["exclude_keywords"]:
-        if exclude_keyword in desc_lower:
-            turbo_excluded = True
-            break
-
-    if not turbo_excluded:
-        turbo_matches = []
-        for keyword in AUTO_DETECT_RULES["turbo"]["keywords"]:
-            if keyword in desc_lower:
-                turbo_matches.append(keyword)
+    if not _TURBO_EXCLUDE_RE.search(desc_lower):
+        turbo_matches = _matched_keywords(_TURBO_RE, AUTO_DETECT_RULES["turbo"]["keywords"], desc_lower)
 
         if turbo_matches:
             return {
@@ -2235,19 +2700,9 @@ def workflow_detect_mode(
                 "matched_keywords": turbo_matches
             }
 
-    # Check for fast mode exclusions
-    fast_excluded = False
-    for exclude_keyword in AUTO_DETECT_RULES["fast"]["exclude_keywords"]:
-        if exclude_keyword in desc_lower:
-            fast_excluded = True
-            break
-
-    if not fast_excluded:
-        # Check for fast mode triggers
-        fast_matches = []
-        for keyword in AUTO_DETECT_RULES["fast"]["keywords"]:
-            if keyword in desc_lower:
-                fast_matches.append(keyword)
+    # Check for fast mode (skipped when an exclusion keyword is present)
+    if not _FAST_EXCLUDE_RE.search(desc_lower):
+        fast_matches = _matched_keywords(_FAST_RE, AUTO_DETECT_RULES["fast"]["keywords"], desc_lower)
 
         if fast_matches:
             return {
@@ -2324,7 +2779,8 @@ def workflow_set_mode(
     mode_config = _resolve_mode(effective_mode, task_id=resolved_task_id)
     if mode_config is None:
         mode_config = WORKFLOW_MODES["full"]
-    state["workflow_mode"]["phases"] = mode_config["phases"]
+    # Copy so the saved state never aliases WORKFLOW_MODES or config lists
+    state["workflow_mode"]["phases"] = list(mode_config["phases"])
     state["workflow_mode"]["estimated_cost"] = mode_config.get("estimated_cost", "unknown")
 
     _save_state(task_dir, state)
@@ -2355,12 +2811,14 @@ def workflow_get_mode(
         }
 
     state = _load_state(task_dir)
-    mode = state.get("workflow_mode", {
-        "requested": "full",
-        "effective": "full",
-        "phases": WORKFLOW_MODES["full"]["phases"],
-        "estimated_cost": WORKFLOW_MODES["full"]["estimated_cost"]
-    })
+    mode = state.get("workflow_mode")
+    if mode is None:
+        mode = {
+            "requested": "full",
+            "effective": "full",
+            "phases": list(WORKFLOW_MODES["full"]["phases"]),
+            "estimated_cost": WORKFLOW_MODES["full"]["estimated_cost"]
+        }
 
     return {
         "task_id": state.get("task_id"),
@@ -2502,6 +2960,31 @@ MODEL_COSTS = {
     "haiku": {"input": 0.80, "output": 4.00}
 }
 
+# Most recent cost entries kept in state.json; older ones move to cost_history.jsonl
+MAX_COST_ENTRIES = 200
+
+# MODEL_COSTS converted from $/1M tokens to $/token once at import
+_COST_PER_TOKEN = {
+    name: {"input": c["input"] * 1e-6, "output": c["output"] * 1e-6}
+    for name, c in MODEL_COSTS.items()
+}
+
+
+def _new_cost_tracking() -> dict:
+    """Empty cost_tracking section for a task state."""
+    return {
+        "entries": [],
+        "totals": {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "compaction_tokens": 0,
+            "total_cost": 0,
+            "duration_seconds": 0
+        },
+        "by_agent": {},
+        "by_model": {}
+    }
+
 
 def workflow_record_cost(
     agent: str,
@@ -2538,32 +3021,22 @@ def workflow_record_cost(
     # Calculate cost (use long-context pricing for opus with >200K input tokens)
     model_lower = model.lower()
     if model_lower == "opus" and input_tokens > 200_000:
-        costs = MODEL_COSTS["opus_long_context"]
+        per_token = _COST_PER_TOKEN["opus_long_context"]
     else:
-        costs = MODEL_COSTS.get(model_lower, MODEL_COSTS["opus"])
-    input_cost = (input_tokens / 1_000_000) * costs["input"]
-    output_cost = (output_tokens / 1_000_000) * costs["output"]
+        per_token = _COST_PER_TOKEN.get(model_lower, _COST_PER_TOKEN["opus"])
+    input_cost = input_tokens * per_token["input"]
+    output_cost = output_tokens * per_token["output"]
     total_cost = input_cost + output_cost
 
     compaction_cost = 0
     if compaction_tokens > 0:
-        compaction_cost = (compaction_tokens / 1_000_000) * MODEL_COSTS["haiku"]["output"]
+        compaction_cost = compaction_tokens * _COST_PER_TOKEN["haiku"]["output"]
         total_cost += compaction_cost
 
     # Initialize cost tracking if needed
-    if "cost_tracking" not in state:
-        state["cost_tracking"] = {
-            "entries": [],
-            "totals": {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "compaction_tokens": 0,
-                "total_cost": 0,
-                "duration_seconds": 0
-            },
-            "by_agent": {},
-            "by_model": {}
-        }
+    tracking = state.get("cost_tracking")
+    if tracking is None:
+        tracking = state["cost_tracking"] = _new_cost_tracking()
 
     # Create entry
     entry = {
@@ -2580,40 +3053,41 @@ def workflow_record_cost(
         "timestamp": datetime.now().isoformat()
     }
 
-    # Update state
-    state["cost_tracking"]["entries"].append(entry)
-    state["cost_tracking"]["totals"]["input_tokens"] += input_tokens
-    state["cost_tracking"]["totals"]["output_tokens"] += output_tokens
-    state["cost_tracking"]["totals"]["compaction_tokens"] += compaction_tokens
-    state["cost_tracking"]["totals"]["total_cost"] += total_cost
-    state["cost_tracking"]["totals"]["duration_seconds"] += duration_seconds
-
-    # Update by-agent totals
-    if agent not in state["cost_tracking"]["by_agent"]:
-        state["cost_tracking"]["by_agent"][agent] = {
-            "input_tokens": 0, "output_tokens": 0, "total_cost": 0, "runs": 0
-        }
-    state["cost_tracking"]["by_agent"][agent]["input_tokens"] += input_tokens
-    state["cost_tracking"]["by_agent"][agent]["output_tokens"] += output_tokens
-    state["cost_tracking"]["by_agent"][agent]["total_cost"] += total_cost
-    state["cost_tracking"]["by_agent"][agent]["runs"] += 1
-
-    # Update by-model totals
-    if model not in state["cost_tracking"]["by_model"]:
-        state["cost_tracking"]["by_model"][model] = {
-            "input_tokens": 0, "output_tokens": 0, "total_cost": 0, "runs": 0
-        }
-    state["cost_tracking"]["by_model"][model]["input_tokens"] += input_tokens
-    state["cost_tracking"]["by_model"][model]["output_tokens"] += output_tokens
-    state["cost_tracking"]["by_model"][model]["total_cost"] += total_cost
-    state["cost_tracking"]["by_model"][model]["runs"] += 1
+    # Update state, spilling the oldest entries to the task's cost history
+    entries = tracking["entries"]
+    entries.append(entry)
+    if len(entries) > MAX_COST_ENTRIES:
+        overflow = entries[:-MAX_COST_ENTRIES]
+        with open(task_dir / "cost_history.jsonl", "ab") as f:
+            f.write(b"".join(map(_dump_json_line, overflow)))
+        del entries[:-MAX_COST_ENTRIES]
+        tracking["archived_entries"] = tracking.get("archived_entries", 0) + len(overflow)
+
+    totals = tracking["totals"]
+    totals["input_tokens"] += input_tokens
+    totals["output_tokens"] += output_tokens
+    totals["compaction_tokens"] += compaction_tokens
+    totals["total_cost"] += total_cost
+    totals["duration_seconds"] += duration_seconds
+
+    # Update by-agent and by-model totals
+    for breakdown, key in ((tracking["by_agent"], agent), (tracking["by_model"], model)):
+        stats = breakdown.get(key)
+        if stats is None:
+            stats = breakdown[key] = {
+                "input_tokens": 0, "output_tokens": 0, "total_cost": 0, "runs": 0
+            }
+        stats["input_tokens"] += input_tokens
+        stats["output_tokens"] += output_tokens
+        stats["total_cost"] += total_cost
+        stats["runs"] += 1
 
     _save_state(task_dir, state)
 
     return {
         "success": True,
         "entry": entry,
-        "running_total": round(state["cost_tracking"]["totals"]["total_cost"], 4),
+        "running_total": round(totals["total_cost"], 4),
         "task_id": state.get("task_id")
     }
 
@@ -2636,12 +3110,9 @@ def workflow_get_cost_summary(
         }
 
     state = _load_state(task_dir)
-    cost_tracking = state.get("cost_tracking", {
-        "entries": [],
-        "totals": {"input_tokens": 0, "output_tokens": 0, "total_cost": 0, "duration_seconds": 0},
-        "by_agent": {},
-        "by_model": {}
-    })
+    cost_tracking = state.get("cost_tracking")
+    if cost_tracking is None:
+        cost_tracking = _new_cost_tracking()
 
     # Calculate mode comparison if we have mode info
     mode = state.get("workflow_mode", {}).get("effective", "full")
@@ -2670,7 +3141,7 @@ def workflow_get_cost_summary(
         "totals": cost_tracking["totals"],
         "by_agent": cost_tracking.get("by_agent", {}),
         "by_model": cost_tracking.get("by_model", {}),
-        "entries_count": len(cost_tracking.get("entries", [])),
+        "entries_count": len(cost_tracking.get("entries", [])) + cost_tracking.get("archived_entries", 0),
         "formatted_summary": "\n".join(summary_lines)
     }
 
@@ -2763,8 +3234,9 @@ def workflow_complete_parallel_phase(
         }
 
     # Store results
+    now_iso = datetime.now().isoformat()
     parallel["results"][phase] = {
-        "completed_at": datetime.now().isoformat(),
+        "completed_at": now_iso,
         "summary": result_summary,
         "concerns": concerns or []
     }
@@ -2777,7 +3249,7 @@ def workflow_complete_parallel_phase(
 
     if all_complete:
         parallel["active"] = False
-        parallel["completed_at"] = datetime.now().isoformat()
+        parallel["completed_at"] = now_iso
 
     _save_state(task_dir, state)
 
@@ -2823,20 +3295,21 @@ def workflow_merge_parallel_results(
     parallel = state["parallel_execution"]
     results = parallel.get("results", {})
 
-    # Collect all concerns
-    all_concerns = []
-    for phase, phase_result in results.items():
-        for concern in phase_result.get("concerns", []):
-            concern["source_phase"] = phase
-            all_concerns.append(concern)
+    # Collect all concerns, tagging copies so the per-phase results stay as recorded
+    all_concerns = [
+        {**concern, "source_phase": phase}
+        for phase, phase_result in results.items()
+        for concern in phase_result.get("concerns", [])
+    ]
 
     # Apply merge strategy
     if merge_strategy == "deduplicate":
-        # Simple deduplication based on description similarity
+        # Simple deduplication based on description similarity; truncate before
+        # lowercasing so long descriptions are not copied in full
         seen_descriptions = set()
         merged_concerns = []
         for concern in all_concerns:
-            desc_key = concern.get("description", "").lower()[:100]
+            desc_key = concern.get("description", "")[:100].lower()
             if desc_key not in seen_descriptions:
                 seen_descriptions.add(desc_key)
                 merged_concerns.append(concern)
@@ -2967,24 +3440,24 @@ def workflow_verify_assertion(
             "error": "No assertions found"
         }
 
-    for assertion in state["assertions"]:
-        if assertion["id"] == assertion_id:
-            assertion["status"] = "passed" if result else "failed"
-            assertion["verified_at"] = datetime.now().isoformat()
-            assertion["result"] = {
-                "passed": result,
-                "message": message
-            }
-            _save_state(task_dir, state)
-            return {
-                "success": True,
-                "assertion": assertion,
-                "task_id": state.get("task_id")
-            }
+    assertion = _find_by_id(state["assertions"], assertion_id, "A")
+    if assertion is None:
+        return {
+            "success": False,
+            "error": f"Assertion {assertion_id} not found"
+        }
 
+    assertion["status"] = "passed" if result else "failed"
+    assertion["verified_at"] = datetime.now().isoformat()
+    assertion["result"] = {
+        "passed": result,
+        "message": message
+    }
+    _save_state(task_dir, state)
     return {
-        "success": False,
-        "error": f"Assertion {assertion_id} not found"
+        "success": True,
+        "assertion": assertion,
+        "task_id": state.get("task_id")
     }
 
 
@@ -3010,28 +3483,28 @@ def workflow_get_assertions(
         }
 
     state = _load_state(task_dir)
-    assertions = state.get("assertions", [])
-
-    # Filter
-    if step_id:
-        assertions = [a for a in assertions if a.get("step_id") == step_id]
-    if status:
-        assertions = [a for a in assertions if a.get("status") == status]
-
-    # Summary counts
-    total = len(state.get("assertions", []))
-    pending = len([a for a in state.get("assertions", []) if a.get("status") == "pending"])
-    passed = len([a for a in state.get("assertions", []) if a.get("status") == "passed"])
-    failed = len([a for a in state.get("assertions", []) if a.get("status") == "failed"])
+    all_assertions = state.get("assertions", [])
+
+    # Filter and count statuses in a single pass
+    counts = Counter()
+    assertions = []
+    for a in all_assertions:
+        a_status = a.get("status")
+        counts[a_status] += 1
+        if step_id and a.get("step_id") != step_id:
+            continue
+        if status and a_status != status:
+            continue
+        assertions.append(a)
 
     return {
         "assertions": assertions,
         "count": len(assertions),
         "summary": {
-            "total": total,
-            "pending": pending,
-            "passed": passed,
-            "failed": failed
+            "total": len(all_assertions),
+            "pending": counts["pending"],
+            "passed": counts["passed"],
+            "failed": counts["failed"]
         },
         "task_id": state.get("task_id")
     }
@@ -3048,6 +3521,63 @@ def _get_error_patterns_file() -> Path:
     return tasks_dir / ".error_patterns.jsonl"
 
 
+# .error_patterns.jsonl is log-structured: a pattern is updated by appending a
+# new line for its signature, and the last line for a signature wins. The file
+# is compacted once it holds this many times more lines than live patterns.
+ERROR_PATTERNS_COMPACT_RATIO = 2
+
+# Parsed pattern index per file: (stat key, {signature: pattern}, line count)
+_error_patterns_cache: dict[Path, tuple[tuple[int, int, int], dict[str, dict], int]] = {}
+
+
+def _load_error_patterns(patterns_file: Path) -> tuple[dict[str, dict], int]:
+    """Return ({signature: latest pattern}, number of lines in the file).
+
+    The index is cached and only rebuilt when the file has changed on disk.
+    """
+    key = _file_stat_key(patterns_file)
+    if key is None:
+        return {}, 0
+
+    cached = _error_patterns_cache.get(patterns_file)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    patterns = _read_jsonl(patterns_file)
+    line_count = len(patterns)
+    index = {pattern.get("signature"): pattern for pattern in patterns}
+
+    _error_patterns_cache[patterns_file] = (key, index, line_count)
+    return index, line_count
+
+
+# (lowercased signature, pattern) pairs per file, keyed like _error_patterns_cache
+_error_signature_pairs_cache: dict[
+    Path, tuple[tuple[int, int, int], list[tuple[str, dict]]]
+] = {}
+
+
+def _error_signature_pairs(patterns_file: Path, index: dict[str, dict]) -> list[tuple[str, dict]]:
+    """Return the non-empty lowercased signatures of index with their patterns.
+
+    index must come from _load_error_patterns(patterns_file). The pairs are
+    cached under the stat key that index was loaded at.
+    """
+    loaded = _error_patterns_cache.get(patterns_file)
+    key = loaded[0] if loaded is not None else None
+    cached = _error_signature_pairs_cache.get(patterns_file)
+    if key is not None and cached is not None and cached[0] == key:
+        return cached[1]
+    pairs = []
+    for p in index.values():
+        signature = p.get("signature", "").lower()
+        if signature:
+            pairs.append((signature, p))
+    if key is not None:
+        _error_signature_pairs_cache[patterns_file] = (key, pairs)
+    return pairs
+
+
 def workflow_record_error_pattern(
     error_signature: str,
     error_type: str,
@@ -3068,62 +3598,67 @@ def workflow_record_error_pattern(
         Recorded pattern
     """
     patterns_file = _get_error_patterns_file()
+    now_iso = datetime.now().isoformat()
 
-    pattern = {
-        "signature": error_signature,
-        "type": error_type,
-        "solution": solution,
-        "tags": tags or [],
-        "times_seen": 1,
-        "last_task": task_id,
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
-    }
-
-    # Check if pattern already exists
-    existing_patterns = []
-    if patterns_file.exists():
-        with open(patterns_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        existing_patterns.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+    with FileLock(str(patterns_file) + ".lock"):
+        index, line_count = _load_error_patterns(patterns_file)
 
-    # Check for existing similar pattern
-    for existing in existing_patterns:
-        if existing.get("signature") == error_signature:
-            existing["times_seen"] = existing.get("times_seen", 1) + 1
-            existing["last_task"] = task_id
-            existing["updated_at"] = datetime.now().isoformat()
+        existing = index.get(error_signature)
+        if existing is not None:
             # Merge tags
             existing_tags = set(existing.get("tags", []))
             existing_tags.update(tags or [])
-            existing["tags"] = list(existing_tags)
-
-            # Rewrite file
-            with open(patterns_file, "w") as f:
-                for p in existing_patterns:
-                    f.write(json.dumps(p) + "\n")
-
-            return {
-                "success": True,
-                "pattern": existing,
-                "action": "updated",
-                "message": f"Updated existing pattern (seen {existing['times_seen']} times)"
+            pattern = {
+                **existing,
+                "times_seen": existing.get("times_seen", 1) + 1,
+                "last_task": task_id,
+                "updated_at": now_iso,
+                "tags": list(existing_tags),
+            }
+            action = "updated"
+            message = f"Updated existing pattern (seen {pattern['times_seen']} times)"
+        else:
+            pattern = {
+                "signature": error_signature,
+                "type": error_type,
+                "solution": solution,
+                "tags": tags or [],
+                "times_seen": 1,
+                "last_task": task_id,
+                "created_at": now_iso,
+                "updated_at": now_iso
             }
+            action = "created"
+            message = "Recorded new error pattern"
 
-    # Add new pattern
-    with open(patterns_file, "a") as f:
-        f.write(json.dumps(pattern) + "\n")
+        # index is the cached dict: update it in place, and drop the cache
+        # entry if the write fails so the next load re-reads the file
+        index[error_signature] = pattern
+        line_count += 1
+
+        try:
+            if line_count > ERROR_PATTERNS_COMPACT_RATIO * len(index):
+                _write_bytes_atomic(
+                    patterns_file,
+                    b"".join(map(_dump_json_line, index.values()))
+                )
+                line_count = len(index)
+            else:
+                with open(patterns_file, "ab") as f:
+                    f.write(_dump_json_line(pattern))
+        except BaseException:
+            _error_patterns_cache.pop(patterns_file, None)
+            raise
+
+        key = _file_stat_key(patterns_file)
+        if key is not None:
+            _error_patterns_cache[patterns_file] = (key, index, line_count)
 
     return {
         "success": True,
         "pattern": pattern,
-        "action": "created",
-        "message": "Recorded new error pattern"
+        "action": action,
+        "message": message
     }
 
 
@@ -3149,24 +3684,12 @@ def workflow_match_error(
             "message": "No error patterns recorded yet"
         }
 
-    patterns = []
-    with open(patterns_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    patterns.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+    index = _load_error_patterns(patterns_file)[0]
 
     error_lower = error_output.lower()
     matches = []
 
-    for pattern in patterns:
-        signature = pattern.get("signature", "").lower()
-        if not signature:
-            continue
-
+    for signature, pattern in _error_signature_pairs(patterns_file, index):
         # Simple substring matching with confidence based on match quality
         if signature in error_lower:
             # Higher confidence for longer, more specific matches
@@ -3190,7 +3713,7 @@ def workflow_match_error(
     return {
         "matches": matches[:5],  # Top 5 matches
         "count": len(matches),
-        "total_patterns": len(patterns)
+        "total_patterns": len(index)
     }
 
 
@@ -3198,6 +3721,11 @@ def workflow_match_error(
 # Agent Performance Tracking
 # ============================================================================
 
+CONCERN_OUTCOMES = ["valid", "false_positive", "partially_valid"]
+
+_CONCERN_OUTCOMES_SET = frozenset(CONCERN_OUTCOMES)
+
+
 def workflow_record_concern_outcome(
     concern_id: str,
     outcome: str,
@@ -3215,11 +3743,10 @@ def workflow_record_concern_outcome(
     Returns:
         Updated concern with outcome
     """
-    valid_outcomes = ["valid", "false_positive", "partially_valid"]
-    if outcome not in valid_outcomes:
+    if outcome not in _CONCERN_OUTCOMES_SET:
         return {
             "success": False,
-            "error": f"Invalid outcome '{outcome}'. Must be one of: {', '.join(valid_outcomes)}"
+            "error": f"Invalid outcome '{outcome}'. Must be one of: {', '.join(CONCERN_OUTCOMES)}"
         }
 
     task_dir = find_task_dir(task_id)
@@ -3237,31 +3764,31 @@ def workflow_record_concern_outcome(
             "error": "No concerns found"
         }
 
-    for concern in state["concerns"]:
-        if concern["id"] == concern_id:
-            concern["outcome"] = {
-                "status": outcome,
-                "notes": notes,
-                "recorded_at": datetime.now().isoformat()
-            }
-            _save_state(task_dir, state)
+    concern = _find_concern(state, concern_id)
+    if concern is None:
+        return {
+            "success": False,
+            "error": f"Concern {concern_id} not found"
+        }
 
-            # Also record to global performance tracking
-            _record_agent_performance(
-                agent=concern.get("source", "unknown"),
-                concern_type=concern.get("severity", "unknown"),
-                outcome=outcome
-            )
+    concern["outcome"] = {
+        "status": outcome,
+        "notes": notes,
+        "recorded_at": datetime.now().isoformat()
+    }
+    _save_state(task_dir, state)
 
-            return {
-                "success": True,
-                "concern": concern,
-                "task_id": state.get("task_id")
-            }
+    # Also record to global performance tracking
+    _record_agent_performance(
+        agent=concern.get("source", "unknown"),
+        concern_type=concern.get("severity", "unknown"),
+        outcome=outcome
+    )
 
     return {
-        "success": False,
-        "error": f"Concern {concern_id} not found"
+        "success": True,
+        "concern": concern,
+        "task_id": state.get("task_id")
     }
 
 
@@ -3276,15 +3803,71 @@ def _record_agent_performance(agent: str, concern_type: str, outcome: str) -> No
     """Record a performance data point for an agent."""
     performance_file = _get_performance_file()
 
+    now = datetime.now()
     entry = {
         "agent": agent,
         "concern_type": concern_type,
         "outcome": outcome,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now.isoformat(),
+        # Epoch copy so readers can filter without parsing the ISO string
+        "ts": now.timestamp()
     }
 
-    with open(performance_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    with open(performance_file, "ab") as f:
+        f.write(_dump_json_line(entry))
+
+
+# Parsed .agent_performance.jsonl per path: (inode, bytes consumed, first bytes
+# of the file, entries as (timestamp, agent, concern_type, outcome)). The file
+# is append-only, so only bytes written since the last read need parsing.
+_performance_cache: dict[Path, tuple[int, int, bytes, list[tuple[float, Any, str, str]]]] = {}
+_PERFORMANCE_HEAD_BYTES = 64
+
+
+def _load_performance_entries(performance_file: Path) -> list[tuple[float, Any, str, str]]:
+    """Return all performance entries, parsing only what was appended since last call."""
+    st = performance_file.stat()
+    cached = _performance_cache.get(performance_file)
+    if cached is not None and cached[0] == st.st_ino and cached[1] == st.st_size:
+        return cached[3]
+
+    with open(performance_file, "rb") as f:
+        head = f.read(_PERFORMANCE_HEAD_BYTES)
+        # Resume only if this is the same file grown by appends
+        if (
+            cached is not None
+            and cached[0] == st.st_ino
+            and cached[1] < st.st_size
+            and head.startswith(cached[2])
+        ):
+            _, offset, _, entries = cached
+        else:
+            offset, entries = 0, []
+        f.seek(offset)
+        data = f.read()
+
+    # Leave a partially written last line for the next call
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        if not line:
+            continue
+        try:
+            entry = _parse_json_bytes(line)
+            entry_time = entry.get("ts")
+            if not isinstance(entry_time, (int, float)):
+                # Entries written before "ts" was recorded
+                entry_time = datetime.fromisoformat(entry.get("timestamp", "")).timestamp()
+        except ValueError:
+            continue
+        entries.append((
+            entry_time,
+            entry.get("agent", "unknown"),
+            entry.get("concern_type", "unknown"),
+            entry.get("outcome", "unknown"),
+        ))
+
+    _performance_cache[performance_file] = (st.st_ino, offset + end, head, entries)
+    return entries
 
 
 def workflow_get_agent_performance(
@@ -3309,30 +3892,20 @@ def workflow_get_agent_performance(
             "message": "No performance data recorded yet"
         }
 
-    # Load and filter by time range
+    # Filter cached entries by time range
     cutoff = datetime.now().timestamp() - (time_range_days * 24 * 60 * 60)
-    entries = []
-
-    with open(performance_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                entry_time = datetime.fromisoformat(entry.get("timestamp", "")).timestamp()
-                if entry_time >= cutoff:
-                    if agent is None or entry.get("agent") == agent:
-                        entries.append(entry)
-            except (json.JSONDecodeError, ValueError):
-                continue
+    total_concerns = 0
 
     # Calculate statistics by agent
     agent_stats = {}
-    for entry in entries:
-        agent_name = entry.get("agent", "unknown")
-        if agent_name not in agent_stats:
-            agent_stats[agent_name] = {
+    for entry_time, agent_name, concern_type, outcome in _load_performance_entries(performance_file):
+        if entry_time < cutoff or (agent is not None and agent_name != agent):
+            continue
+        total_concerns += 1
+
+        stats = agent_stats.get(agent_name)
+        if stats is None:
+            stats = agent_stats[agent_name] = {
                 "total": 0,
                 "valid": 0,
                 "false_positive": 0,
@@ -3340,10 +3913,8 @@ def workflow_get_agent_performance(
                 "by_type": {}
             }
 
-        stats = agent_stats[agent_name]
         stats["total"] += 1
 
-        outcome = entry.get("outcome", "unknown")
         if outcome == "valid":
             stats["valid"] += 1
         elif outcome == "false_positive":
@@ -3352,12 +3923,12 @@ def workflow_get_agent_performance(
             stats["partially_valid"] += 1
 
         # Track by concern type
-        concern_type = entry.get("concern_type", "unknown")
-        if concern_type not in stats["by_type"]:
-            stats["by_type"][concern_type] = {"total": 0, "valid": 0}
-        stats["by_type"][concern_type]["total"] += 1
-        if outcome in ["valid", "partially_valid"]:
-            stats["by_type"][concern_type]["valid"] += 1
+        type_stats = stats["by_type"].get(concern_type)
+        if type_stats is None:
+            type_stats = stats["by_type"][concern_type] = {"total": 0, "valid": 0}
+        type_stats["total"] += 1
+        if outcome in ("valid", "partially_valid"):
+            type_stats["valid"] += 1
 
     # Calculate precision for each agent
     for agent_name, stats in agent_stats.items():
@@ -3371,7 +3942,7 @@ def workflow_get_agent_performance(
 
     return {
         "agents": agent_stats,
-        "total_concerns": len(entries),
+        "total_concerns": total_concerns,
         "time_range_days": time_range_days,
         "message": f"Performance data for last {time_range_days} days"
     }
@@ -3381,6 +3952,11 @@ def workflow_get_agent_performance(
 # Optional Phase Management
 # ============================================================================
 
+OPTIONAL_PHASES = ["security_auditor", "performance_analyst", "api_guardian", "accessibility_reviewer"]
+
+_OPTIONAL_PHASES_SET = frozenset(OPTIONAL_PHASES)
+
+
 def workflow_enable_optional_phase(
     phase: str,
     reason: str = "",
@@ -3398,12 +3974,10 @@ def workflow_enable_optional_phase(
     Returns:
         Updated workflow mode
     """
-    optional_phases = ["security_auditor", "performance_analyst", "api_guardian", "accessibility_reviewer"]
-
-    if phase not in optional_phases:
+    if phase not in _OPTIONAL_PHASES_SET:
         return {
             "success": False,
-            "error": f"Unknown optional phase '{phase}'. Available: {', '.join(optional_phases)}"
+            "error": f"Unknown optional phase '{phase}'. Available: {', '.join(OPTIONAL_PHASES)}"
         }
 
     task_dir = find_task_dir(task_id)
@@ -3470,21 +4044,33 @@ def workflow_get_optional_phases(
 # Git Worktree Support
 # ============================================================================
 
+# WSL detection result; the kernel can't change under a running process
+_cached_is_wsl: Optional[bool] = None
+
+
 def _is_wsl() -> bool:
-    """Detect if running inside WSL."""
-    try:
-        with open("/proc/version") as f:
-            return "microsoft" in f.read().lower()
-    except (FileNotFoundError, PermissionError):
-        return False
+    """Detect if running inside WSL, reading /proc/version once per process."""
+    global _cached_is_wsl
+    if _cached_is_wsl is None:
+        try:
+            with open("/proc/version") as f:
+                _cached_is_wsl = "microsoft" in f.read().lower()
+        except (FileNotFoundError, PermissionError):
+            _cached_is_wsl = False
+    return _cached_is_wsl
+
+
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9\s_-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s_]+')
+_SLUG_DASHES_RE = re.compile(r'-+')
 
 
 def _slugify(text: str) -> str:
     """Convert text to git-branch-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r'[^a-z0-9\s_-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = _SLUG_INVALID_RE.sub('', text)
+    text = _SLUG_SEPARATOR_RE.sub('-', text)
+    text = _SLUG_DASHES_RE.sub('-', text)
     return text.strip('-')
 
 
@@ -3498,14 +4084,12 @@ def _find_recyclable_worktree() -> Optional[tuple[Path, dict]]:
     if not tasks_dir.exists():
         return None
 
-    for task_dir in sorted(tasks_dir.iterdir()):
-        if not task_dir.is_dir():
-            continue
-        state_file = task_dir / "state.json"
-        if not state_file.exists():
+    for task_dir in _list_task_dirs(tasks_dir):
+        # Cached per state.json version, so non-donors are not re-parsed
+        summary = _task_summary(task_dir)
+        if summary is None:
             continue
-        state = _load_state(task_dir)
-        worktree = state.get("worktree")
+        worktree = summary["worktree"]
         if not worktree or worktree.get("status") != "recyclable":
             continue
         # Check that the directory still exists on disk
@@ -3515,7 +4099,7 @@ def _find_recyclable_worktree() -> Optional[tuple[Path, dict]]:
         # Resolve relative to main repo
         abs_path = os.path.normpath(os.path.join(str(Path.cwd()), wt_path))
         if os.path.isdir(abs_path):
-            return (task_dir, state)
+            return (task_dir, _load_state(task_dir))
 
     return None
 
@@ -3536,6 +4120,64 @@ def _generate_branch_name(task_id: str, state: dict) -> str:
     return f"crew/{task_id.lower().replace('_', '-')}"
 
 
+# Worktree permissions template per main repo path ("" when none exists)
+_perms_template_cache: dict[str, str] = {}
+
+
+def _find_perms_template(main_repo_abs: str) -> str:
+    """Locate the worktree permissions template, memoized per repo."""
+    cached = _perms_template_cache.get(main_repo_abs)
+    if cached is not None:
+        return cached
+
+    perms_tpl = ""
+    for candidate in [
+        os.path.join(main_repo_abs, "config", "worktree-permissions.json"),
+        os.path.expanduser("~/.claude/config/worktree-permissions.json"),
+    ]:
+        if os.path.isfile(candidate):
+            perms_tpl = candidate
+            break
+    _perms_template_cache[main_repo_abs] = perms_tpl
+    return perms_tpl
+
+
+def _build_setup_commands(main_repo_abs: str, worktree_abs: str, ai_host: str) -> list[str]:
+    """Build the commands that prepare a worktree: symlink .tasks/ and copy host settings."""
+    setup_commands = [
+        f"ln -sfn {shlex.quote(os.path.join(main_repo_abs, '.tasks'))} {shlex.quote(os.path.join(worktree_abs, '.tasks'))}"
+    ]
+
+    main_tasks_abs = os.path.join(main_repo_abs, ".tasks")
+    perms_tpl = _find_perms_template(main_repo_abs)
+
+    # Quote the per-call constants once; the scripts are quoted at import
+    quoted_tasks = shlex.quote(main_tasks_abs)
+    quoted_perms = f" {shlex.quote(perms_tpl)}" if perms_tpl else ""
+
+    for settings_file in _HOST_SETTINGS.get(ai_host, []):
+        if settings_file == "gemini_trust":
+            setup_commands.append(
+                f"python3 -c {_QUOTED_GEMINI_TRUST_SCRIPT} "
+                f"{shlex.quote(worktree_abs)}"
+            )
+            continue
+        src = os.path.join(main_repo_abs, settings_file)
+        dest = os.path.join(worktree_abs, settings_file)
+        # Copy settings, inject additionalDirectories + baseline permissions
+        # so the AI host can access .tasks/ and use workflow tools without prompts.
+        setup_commands.append(
+            f"python3 -c {_QUOTED_SETTINGS_PATCH_SCRIPT} "
+            f"{shlex.quote(src)} {shlex.quote(dest)} {quoted_tasks}{quoted_perms}"
+        )
+
+    return setup_commands
+
+
+# First run of digits in a task ID, used to pick its color scheme
+_TASK_NUM_RE = re.compile(r'\d+')
+
+
 def workflow_create_worktree(
     task_id: Optional[str] = None,
     base_path: Optional[str] = None,
@@ -3581,7 +4223,9 @@ def workflow_create_worktree(
         }
 
     # Determine repo name from cwd
-    repo_name = Path.cwd().name
+    cwd = Path.cwd()
+    main_repo_abs = str(cwd.resolve())
+    repo_name = cwd.name
 
     # WSL + /mnt/ detection for performance warnings and native commands
     wsl = _is_wsl()
@@ -3590,9 +4234,8 @@ def workflow_create_worktree(
 
     if wsl and not base_path:
         # Check for wsl_native_path config override
-        from agentic_workflow_server.config_tools import config_get_effective
-        effective = config_get_effective(task_id=resolved_task_id)
-        wsl_native_path = effective["config"].get("worktree", {}).get("wsl_native_path", "")
+        config = _get_effective_config(resolved_task_id)
+        wsl_native_path = config.get("worktree", {}).get("wsl_native_path", "")
         if wsl_native_path:
             # Substitute placeholders
             wsl_native_path = wsl_native_path.replace("{user}", os.getenv("USER", ""))
@@ -3607,7 +4250,7 @@ def workflow_create_worktree(
     worktree_path = f"{base_path}/{resolved_task_id}"
 
     # Resolve absolute path to check if it's on /mnt/ (NTFS via 9P)
-    resolved_abs = os.path.normpath(os.path.join(str(Path.cwd().resolve()), worktree_path))
+    resolved_abs = os.path.normpath(os.path.join(main_repo_abs, worktree_path))
     if wsl and resolved_abs.startswith("/mnt/"):
         wsl_use_native_commands = True
         warnings.append(
@@ -3618,10 +4261,12 @@ def workflow_create_worktree(
         )
 
     # Assign a color scheme based on the numeric portion of the task ID
-    task_num_match = re.search(r'\d+', resolved_task_id)
+    task_num_match = _TASK_NUM_RE.search(resolved_task_id)
     task_num = int(task_num_match.group()) if task_num_match else 0
     color_scheme_index = task_num % len(CREW_COLOR_SCHEMES)
 
+    now_iso = datetime.now().isoformat()
+
     # Try recycling an existing worktree
     donor = None
     if recycle:
@@ -3640,7 +4285,7 @@ def workflow_create_worktree(
             "branch": branch_name,
             "base_branch": base_branch,
             "color_scheme_index": color_scheme_index,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "recycled_from": donor_task_id,
         }
 
@@ -3650,7 +4295,7 @@ def workflow_create_worktree(
         # Mark donor as recycled
         donor_state["worktree"]["status"] = "recycled"
         donor_state["worktree"]["recycled_to"] = resolved_task_id
-        donor_state["worktree"]["recycled_at"] = datetime.now().isoformat()
+        donor_state["worktree"]["recycled_at"] = now_iso
         _save_state(donor_dir, donor_state)
 
         # Git commands: move worktree dir, switch to base branch, create new branch, delete old
@@ -3661,42 +4306,7 @@ def workflow_create_worktree(
             f"git branch -d {donor_branch}",
         ]
 
-        # Build setup commands (symlink .tasks/ + copy host settings)
-        main_repo_abs = str(Path.cwd().resolve())
-        worktree_abs = os.path.normpath(os.path.join(main_repo_abs, worktree_path))
-
-        setup_commands = [
-            f"ln -sfn {shlex.quote(os.path.join(main_repo_abs, '.tasks'))} {shlex.quote(os.path.join(worktree_abs, '.tasks'))}"
-        ]
-
-        main_tasks_abs = os.path.join(main_repo_abs, ".tasks")
-
-        # Locate permissions template
-        perms_tpl = ""
-        for candidate in [
-            os.path.join(main_repo_abs, "config", "worktree-permissions.json"),
-            os.path.expanduser("~/.claude/config/worktree-permissions.json"),
-        ]:
-            if os.path.isfile(candidate):
-                perms_tpl = candidate
-                break
-
-        for settings_file in _HOST_SETTINGS.get(ai_host, []):
-            if settings_file == "gemini_trust":
-                setup_commands.append(
-                    f"python3 -c {shlex.quote(_GEMINI_TRUST_SCRIPT)} "
-                    f"{shlex.quote(worktree_abs)}"
-                )
-                continue
-            src = os.path.join(main_repo_abs, settings_file)
-            dest = os.path.join(worktree_abs, settings_file)
-            cmd = (
-                f"python3 -c {shlex.quote(_SETTINGS_PATCH_SCRIPT)} "
-                f"{shlex.quote(src)} {shlex.quote(dest)} {shlex.quote(main_tasks_abs)}"
-            )
-            if perms_tpl:
-                cmd += f" {shlex.quote(perms_tpl)}"
-            setup_commands.append(cmd)
+        setup_commands = _build_setup_commands(main_repo_abs, resolved_abs, ai_host)
 
         return {
             "success": True,
@@ -3718,50 +4328,13 @@ def workflow_create_worktree(
         "branch": branch_name,
         "base_branch": base_branch,
         "color_scheme_index": color_scheme_index,
-        "created_at": datetime.now().isoformat()
+        "created_at": now_iso
     }
 
     state["worktree"] = worktree_metadata
     _save_state(task_dir, state)
 
-    # Build setup commands (symlink .tasks/ + copy host settings)
-    main_repo_abs = str(Path.cwd().resolve())
-    worktree_abs = os.path.normpath(os.path.join(main_repo_abs, worktree_path))
-
-    setup_commands = [
-        f"ln -sfn {shlex.quote(os.path.join(main_repo_abs, '.tasks'))} {shlex.quote(os.path.join(worktree_abs, '.tasks'))}"
-    ]
-
-    main_tasks_abs = os.path.join(main_repo_abs, ".tasks")
-
-    # Locate permissions template
-    perms_tpl = ""
-    for candidate in [
-        os.path.join(main_repo_abs, "config", "worktree-permissions.json"),
-        os.path.expanduser("~/.claude/config/worktree-permissions.json"),
-    ]:
-        if os.path.isfile(candidate):
-            perms_tpl = candidate
-            break
-
-    for settings_file in _HOST_SETTINGS.get(ai_host, []):
-        if settings_file == "gemini_trust":
-            setup_commands.append(
-                f"python3 -c {shlex.quote(_GEMINI_TRUST_SCRIPT)} "
-                f"{shlex.quote(worktree_abs)}"
-            )
-            continue
-        src = os.path.join(main_repo_abs, settings_file)
-        dest = os.path.join(worktree_abs, settings_file)
-        # Copy settings, inject additionalDirectories + baseline permissions
-        # so the AI host can access .tasks/ and use workflow tools without prompts.
-        cmd = (
-            f"python3 -c {shlex.quote(_SETTINGS_PATCH_SCRIPT)} "
-            f"{shlex.quote(src)} {shlex.quote(dest)} {shlex.quote(main_tasks_abs)}"
-        )
-        if perms_tpl:
-            cmd += f" {shlex.quote(perms_tpl)}"
-        setup_commands.append(cmd)
+    setup_commands = _build_setup_commands(main_repo_abs, resolved_abs, ai_host)
 
     # Build fix_paths_commands for WSL/Windows compatibility.
     # After `git worktree add`, the .git file and .git/worktrees/TASK/gitdir
@@ -3937,6 +4510,10 @@ with open(dst, "w") as f:
     f.write("\\n")
 """
 
+# Shell-quoted once; both scripts are embedded in every setup command
+_QUOTED_GEMINI_TRUST_SCRIPT = shlex.quote(_GEMINI_TRUST_SCRIPT)
+_QUOTED_SETTINGS_PATCH_SCRIPT = shlex.quote(_SETTINGS_PATCH_SCRIPT)
+
 
 def _build_resume_prompt(task_id: str, main_tasks_path: str, ai_host: str = "claude") -> str:
     """Build the resume prompt string for a worktree session."""
@@ -3957,6 +4534,74 @@ def _build_resume_prompt(task_id: str, main_tasks_path: str, ai_host: str = "cla
     )
 
 
+def _launch_tmux(
+    safe_task_id: str, safe_path: str, cli_with_prompt: str, launch_mode: str, scheme: dict
+) -> list[str]:
+    """tmux: open new window, cd to worktree, run CLI with prompt."""
+    return [
+        f"tmux new-window -n {safe_task_id} -c {safe_path} "
+        f"{shlex.quote(cli_with_prompt)}",
+        # Apply per-window background color so each task is visually distinct
+        f"tmux set-option -t {safe_task_id} -w window-style "
+        f"'bg={scheme['bg']},fg={scheme['fg']}'",
+    ]
+
+
+def _launch_windows_terminal(
+    safe_task_id: str, safe_path: str, cli_with_prompt: str, launch_mode: str, scheme: dict
+) -> list[str]:
+    """Windows Terminal from WSL: run wsl.exe as the tab/window process.
+
+    WT opens a WSL session with --cd as the working directory.
+    bash -lic: -l (login, sources .profile) + -i (interactive, sources
+    .bashrc where nvm/fnm/volta add CLI tools to PATH) + -c (command).
+    --tabColor and --colorScheme give each task a distinct visual identity.
+    """
+    if launch_mode == "window":
+        wt_cmd = (
+            f"wt.exe new-window "
+            f"--title {safe_task_id} "
+            f"--colorScheme \"{scheme['name']}\" "
+            f"wsl.exe --cd {safe_path} "
+            f"-- bash -lic {shlex.quote(cli_with_prompt)}"
+        )
+    else:
+        wt_cmd = (
+            f"wt.exe new-tab "
+            f"--title {safe_task_id} "
+            f"--tabColor \"{scheme['tab']}\" "
+            f"--colorScheme \"{scheme['name']}\" "
+            f"wsl.exe --cd {safe_path} "
+            f"-- bash -lic {shlex.quote(cli_with_prompt)}"
+        )
+    return [wt_cmd]
+
+
+def _launch_macos(
+    safe_task_id: str, safe_path: str, cli_with_prompt: str, launch_mode: str, scheme: dict
+) -> list[str]:
+    """macOS Terminal: use osascript to open new Terminal window."""
+    inner_script = f"cd {safe_path} && {cli_with_prompt}"
+    return [
+        f'osascript -e \'tell app "Terminal" to do script {shlex.quote(inner_script)}\''
+    ]
+
+
+# Launch command builders per terminal_env; other environments get a warning
+_LAUNCHERS: dict[str, Callable[[str, str, str, str, dict], list[str]]] = {
+    "tmux": _launch_tmux,
+    "windows_terminal": _launch_windows_terminal,
+    "macos": _launch_macos,
+}
+
+# Launch mode used for launch_mode="auto" per terminal_env (default: window)
+_AUTO_LAUNCH_MODES = {
+    "tmux": "window",
+    "windows_terminal": "tab",
+    "macos": "window",
+}
+
+
 def workflow_get_launch_command(
     task_id: Optional[str] = None,
     terminal_env: str = "unknown",
@@ -4046,60 +4691,11 @@ def workflow_get_launch_command(
     if launch_mode not in ("auto", "window", "tab"):
         launch_mode = "auto"
     if launch_mode == "auto":
-        _auto_defaults = {
-            "tmux": "window",
-            "windows_terminal": "tab",
-            "macos": "window",
-        }
-        launch_mode = _auto_defaults.get(terminal_env, "window")
-
-    if terminal_env == "tmux":
-        # tmux: open new window, cd to worktree, run CLI with prompt
-        tmux_cmd = (
-            f"tmux new-window -n {safe_task_id} -c {safe_path} "
-            f"{shlex.quote(cli_with_prompt)}"
-        )
-        launch_commands.append(tmux_cmd)
-        # Apply per-window background color so each task is visually distinct
-        tmux_style_cmd = (
-            f"tmux set-option -t {safe_task_id} -w window-style "
-            f"'bg={scheme['bg']},fg={scheme['fg']}'"
-        )
-        launch_commands.append(tmux_style_cmd)
-
-    elif terminal_env == "windows_terminal":
-        # Windows Terminal from WSL: run wsl.exe as the tab/window process so WT
-        # opens a WSL session. Use --cd for the working directory.
-        # bash -lic: -l (login, sources .profile) + -i (interactive, sources
-        # .bashrc where nvm/fnm/volta add CLI tools to PATH) + -c (command).
-        # --tabColor and --colorScheme give each task a distinct visual identity.
-        if launch_mode == "window":
-            wt_cmd = (
-                f"wt.exe new-window "
-                f"--title {safe_task_id} "
-                f"--colorScheme \"{scheme['name']}\" "
-                f"wsl.exe --cd {safe_path} "
-                f"-- bash -lic {shlex.quote(cli_with_prompt)}"
-            )
-        else:
-            wt_cmd = (
-                f"wt.exe new-tab "
-                f"--title {safe_task_id} "
-                f"--tabColor \"{scheme['tab']}\" "
-                f"--colorScheme \"{scheme['name']}\" "
-                f"wsl.exe --cd {safe_path} "
-                f"-- bash -lic {shlex.quote(cli_with_prompt)}"
-            )
-        launch_commands.append(wt_cmd)
-
-    elif terminal_env == "macos":
-        # macOS Terminal: use osascript to open new Terminal window
-        inner_script = f"cd {safe_path} && {cli_with_prompt}"
-        osa_cmd = (
-            f'osascript -e \'tell app "Terminal" to do script {shlex.quote(inner_script)}\''
-        )
-        launch_commands.append(osa_cmd)
+        launch_mode = _AUTO_LAUNCH_MODES.get(terminal_env, "window")
 
+    launcher = _LAUNCHERS.get(terminal_env)
+    if launcher is not None:
+        launch_commands = launcher(safe_task_id, safe_path, cli_with_prompt, launch_mode, scheme)
     else:
         # linux_generic or unknown: cannot reliably open a new terminal
         warnings.append(
@@ -4176,13 +4772,7 @@ def workflow_log_interaction(
     if metadata:
         entry["metadata"] = metadata
 
-    interactions_file = task_dir / "interactions.jsonl"
-    lock_file = task_dir / "interactions.jsonl.lock"
-    lock = FileLock(str(lock_file), timeout=5)
-
-    with lock:
-        with open(interactions_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+    _append_interaction(task_dir, entry)
 
     return {
         "success": True,
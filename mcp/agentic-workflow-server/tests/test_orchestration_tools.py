@@ -34,6 +34,7 @@ from agentic_workflow_server.state_tools import (
     workflow_set_mode,
     workflow_set_implementation_progress,
     workflow_complete_step,
+    workflow_get_state,
     _slugify as state_slugify,
     _generate_branch_name as state_generate_branch_name,
 )
@@ -286,6 +287,19 @@ class TestCrewParseAgentOutput:
         assert result["extracted"]["recommendation"] == "REVISE"
         assert result["has_blocking_issues"] is True
 
+    def test_parse_review_issues_records_them_on_task(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_ORCH_009")
+        output = (
+            '<review_issues>[{"description": "No tests", "severity": "high"}, '
+            '"Typo in docstring"]</review_issues>'
+        )
+        crew_parse_agent_output("reviewer", output, task_id="TASK_ORCH_009")
+        issues = workflow_get_state(task_id="TASK_ORCH_009")["review_issues"]
+        assert [(i["type"], i["description"], i["severity"]) for i in issues] == [
+            ("review", "No tests", "high"),
+            ("review", "Typo in docstring", "medium"),
+        ]
+
     def test_parse_approve_recommendation(self):
         output = '''
         <recommendation>APPROVE</recommendation>
@@ -203,6 +203,70 @@ class TestWorkflowInitialization:
         assert result["success"] is False
         assert "already exists" in result["error"]
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_state_roundtrip_with_and_without_orjson(self, clean_tasks_dir, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(_state_mod, "orjson", None)
+        elif _state_mod.orjson is None:
+            pytest.skip("orjson not installed")
+        task_dir = clean_tasks_dir / "TASK_TEST_006"
+        state = _state_mod._create_default_state("TASK_TEST_006")
+        state["description"] = "Fix caf\u00e9 menu"
+        state["misc"] = {1: "non-str key"}
+        _save_state(task_dir, state)
+
+        loaded = _load_state(task_dir)
+        assert loaded["description"] == "Fix caf\u00e9 menu"
+        assert loaded["misc"] == {"1": "non-str key"}
+        raw = (task_dir / "state.json").read_bytes()
+        assert "Fix caf\u00e9 menu".encode("utf-8") in raw
+        assert json.loads(raw.decode("utf-8"))["task_id"] == "TASK_TEST_006"
+
+    @pytest.mark.skipif(_state_mod.orjson is None, reason="orjson not installed")
+    def test_stdlib_fallback_writes_same_bytes_as_orjson(self, monkeypatch):
+        data = {"description": "Fix caf\u00e9 \u2713", "n": [1, 2.5, {"a": None}], "e": {}}
+        expected = (_state_mod._dump_json_bytes(data), _state_mod._dump_json_line(data))
+
+        monkeypatch.setattr(_state_mod, "orjson", None)
+        assert (_state_mod._dump_json_bytes(data), _state_mod._dump_json_line(data)) == expected
+
+    def test_cached_load_returns_independent_copies(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_007")
+        task_dir = clean_tasks_dir / "TASK_TEST_007"
+
+        first = _load_state(task_dir)
+        first["phases_completed"].append("architect")
+
+        assert _load_state(task_dir)["phases_completed"] == []
+
+    def test_load_sees_external_state_writes(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_008")
+        task_dir = clean_tasks_dir / "TASK_TEST_008"
+        _load_state(task_dir)
+
+        state = json.loads((task_dir / "state.json").read_text())
+        state["description"] = "edited by another process"
+        (task_dir / "state.json").write_text(json.dumps(state))
+
+        assert _load_state(task_dir)["description"] == "edited by another process"
+
+    def test_failed_save_keeps_previous_state(self, clean_tasks_dir, monkeypatch):
+        workflow_initialize(task_id="TASK_TEST_009")
+        task_dir = clean_tasks_dir / "TASK_TEST_009"
+        before = (task_dir / "state.json").read_bytes()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(_state_mod.os, "replace", fail_replace)
+        state = _load_state(task_dir)
+        state["description"] = "never written"
+        with pytest.raises(OSError):
+            _save_state(task_dir, state)
+
+        assert (task_dir / "state.json").read_bytes() == before
+        assert not list(task_dir.glob("state.json.*.tmp"))
+
 
 class TestWorkflowTransitions:
     """Test phase transitions and workflow progression."""
@@ -331,14 +395,35 @@ class TestContextManagement:
         lines = [f"Line {i}" for i in range(100)]
         (task_dir / "repomix-output.txt").write_text("\n".join(lines))
 
-        workflow_prune_old_outputs(task_id="TASK_TEST_032", keep_last_n=0)
+        result = workflow_prune_old_outputs(task_id="TASK_TEST_032", keep_last_n=0)
 
-        summary_file = task_dir / "pruned" / "repomix-output_summary.json"
-        assert summary_file.exists()
+        summaries_file = task_dir / "pruned" / "summaries.jsonl"
+        assert summaries_file.exists()
 
-        summary = json.loads(summary_file.read_text())
+        summaries = [json.loads(line) for line in summaries_file.read_text().splitlines()]
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert summary["original_file"] == "repomix-output.txt"
         assert "original_size_bytes" in summary
         assert "total_lines" in summary
+        assert result["pruned_files"][0]["summary_at"] == "pruned/summaries.jsonl"
+        assert result["pruned_files"][0]["summary_offset"] == 0
+
+    def test_prune_appends_to_existing_summaries(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_033")
+        task_dir = clean_tasks_dir / "TASK_TEST_033"
+
+        (task_dir / "first.log").write_text("first\n")
+        workflow_prune_old_outputs(task_id="TASK_TEST_033", keep_last_n=0)
+        (task_dir / "second.log").write_text("second\n")
+        result = workflow_prune_old_outputs(task_id="TASK_TEST_033", keep_last_n=0)
+
+        raw = (task_dir / "pruned" / "summaries.jsonl").read_bytes()
+        lines = raw.splitlines()
+        assert [json.loads(line)["original_file"] for line in lines] == ["first.log", "second.log"]
+        offset = result["pruned_files"][0]["summary_offset"]
+        assert offset == len(lines[0]) + 1
+        assert json.loads(raw[offset:].split(b"\n", 1)[0])["original_file"] == "second.log"
 
 
 class TestCrossTaskMemory:
@@ -385,6 +470,22 @@ class TestCrossTaskMemory:
         assert "built_upon_by" in linked["linked_tasks"]
         assert "TASK_CROSS_011" in linked["linked_tasks"]["built_upon_by"]
 
+    def test_link_tasks_relink_skips_writes(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_CROSS_012")
+        workflow_initialize(task_id="TASK_CROSS_013")
+        workflow_link_tasks(task_id="TASK_CROSS_013", related_task_ids=["TASK_CROSS_012"])
+
+        before = {
+            t: (clean_tasks_dir / t / "state.json").read_text()
+            for t in ("TASK_CROSS_012", "TASK_CROSS_013")
+        }
+        result = workflow_link_tasks(task_id="TASK_CROSS_013", related_task_ids=["TASK_CROSS_012"])
+
+        assert result["success"] is True
+        assert result["new_links"] == []
+        for t, text in before.items():
+            assert (clean_tasks_dir / t / "state.json").read_text() == text
+
     def test_get_linked_tasks_with_memories(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_CROSS_020")
         workflow_initialize(task_id="TASK_CROSS_021")
@@ -447,6 +548,31 @@ class TestModelResilience:
         assert result["model"] == "claude-opus-4"  # Second in fallback chain
         assert result["is_fallback"] is True
 
+    def test_get_available_model_healthy_preferred_skips_sweep(self, clean_tasks_dir):
+        workflow_record_model_error("claude-opus-4", "rate_limit")
+
+        result = workflow_get_available_model(
+            preferred_model="claude-sonnet-4", include_diagnostics=False
+        )
+
+        assert result["model"] == "claude-sonnet-4"
+        assert result["is_fallback"] is False
+        assert result["checked_models"] == []
+
+    def test_get_available_model_diagnostics(self, clean_tasks_dir):
+        workflow_record_model_error("claude-opus-4-6", "rate_limit")
+
+        lean = workflow_get_available_model(include_diagnostics=False)
+        assert lean["model"] == "claude-opus-4"
+        assert lean["checked_models"] == []
+
+        full = workflow_get_available_model()
+        assert full["model"] == "claude-opus-4"
+        assert [m["model"] for m in full["checked_models"]] == [
+            "claude-opus-4-6", "claude-opus-4", "claude-sonnet-4", "gemini"
+        ]
+        assert full["checked_models"][0]["in_cooldown"] is True
+
     def test_all_models_in_cooldown(self, clean_tasks_dir):
         # Put all models in cooldown
         workflow_record_model_error("claude-opus-4-6", "rate_limit")
@@ -605,6 +731,30 @@ class TestWorkflowModes:
         assert "developer" in result["workflow_mode"]["phases"]
         assert "architect" not in result["workflow_mode"]["phases"]
 
+    def test_set_mode_phases_do_not_alias_builtin_modes(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_104")
+
+        result = workflow_set_mode("minimal", task_id="TASK_TEST_104")
+        result["workflow_mode"]["phases"].append("architect")
+
+        assert "architect" not in _state_mod.WORKFLOW_MODES["minimal"]["phases"]
+
+    def test_custom_mode_reloaded_when_config_changes(self, tmp_path, monkeypatch):
+        import os
+        monkeypatch.chdir(tmp_path)
+        config_file = tmp_path / ".claude" / "workflow-config.yaml"
+        config_file.parent.mkdir()
+        config_file.write_text("workflow_modes:\n  modes:\n    quick:\n      phases: [developer]\n")
+
+        assert _state_mod._resolve_mode("quick")["phases"] == ["developer"]
+        assert "quick" in _state_mod._get_all_mode_names()
+
+        config_file.write_text("workflow_modes:\n  modes:\n    quick:\n      phases: [developer, reviewer]\n")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert _state_mod._resolve_mode("quick")["phases"] == ["developer", "reviewer"]
+
     def test_set_mode_auto(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_TEST_101", description="Fix typo in docs")
 
@@ -822,6 +972,17 @@ class TestFindActiveTaskIsolation:
         assert result is not None
         assert result.name == "TASK_TEST_ISO_008"
 
+    def test_find_task_dir_case_insensitive_cache_revalidates(self, isolated_tasks_dir):
+        """A cached case-insensitive match is dropped once the dir disappears."""
+        workflow_initialize(task_id="TASK_TEST_ISO_013")
+        td = isolated_tasks_dir / "TASK_TEST_ISO_013"
+
+        assert find_task_dir("task_test_iso_013") == td
+        assert find_task_dir("task_test_iso_013") == td
+
+        shutil.rmtree(td)
+        assert find_task_dir("task_test_iso_013") is None
+
     def test_find_task_dir_missing_tasks_dir_returns_none(self):
         """find_task_dir returns None (not crash) when .tasks/ doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -876,6 +1037,34 @@ class TestFindActiveTaskIsolation:
         result = _find_active_task_dir()
         assert result is None  # no tasks in isolated dir
 
+    def test_scan_sees_state_changes_after_earlier_scan(self, isolated_tasks_dir):
+        """Cached task summaries are refreshed once state.json changes."""
+        workflow_initialize(task_id="TASK_TEST_ISO_014")
+        td = isolated_tasks_dir / "TASK_TEST_ISO_014"
+        assert _find_active_task_dir() == td
+
+        state = _load_state(td)
+        state["status"] = "completed"
+        _save_state(td, state)
+
+        assert _find_active_task_dir() is None
+
+    def test_load_after_scan_reuses_scanned_bytes(self, isolated_tasks_dir, monkeypatch):
+        """The state.json read by the active-task scan serves the next _load_state."""
+        workflow_initialize(task_id="TASK_TEST_ISO_015")
+        td = isolated_tasks_dir / "TASK_TEST_ISO_015"
+        state = json.loads((td / "state.json").read_text())
+        state["description"] = "edited by another process"
+        (td / "state.json").write_text(json.dumps(state))
+
+        assert _find_active_task_dir() == td
+
+        def no_lock(path):
+            raise AssertionError("state.json re-read under lock")
+
+        monkeypatch.setattr(_state_mod, "FileLock", no_lock)
+        assert _load_state(td)["description"] == "edited by another process"
+
 
 class TestCostTracking:
     """Test cost tracking and reporting."""
@@ -913,6 +1102,23 @@ class TestCostTracking:
         assert result["totals"]["total_cost"] > 0
         assert "formatted_summary" in result
 
+    def test_cost_entries_spill_to_history(self, clean_tasks_dir, monkeypatch):
+        monkeypatch.setattr(_state_mod, "MAX_COST_ENTRIES", 3)
+        workflow_initialize(task_id="TASK_TEST_112")
+
+        for i in range(5):
+            workflow_record_cost(f"agent{i}", "opus", 1000, 100, task_id="TASK_TEST_112")
+
+        task_dir = clean_tasks_dir / "TASK_TEST_112"
+        state = _load_state(task_dir)
+        assert [e["agent"] for e in state["cost_tracking"]["entries"]] == ["agent2", "agent3", "agent4"]
+        history = (task_dir / "cost_history.jsonl").read_text().splitlines()
+        assert [json.loads(line)["agent"] for line in history] == ["agent0", "agent1"]
+
+        result = workflow_get_cost_summary(task_id="TASK_TEST_112")
+        assert result["entries_count"] == 5
+        assert result["by_agent"]["agent0"]["runs"] == 1
+
 
 class TestParallelization:
     """Test parallel phase execution."""
@@ -981,6 +1187,29 @@ class TestParallelization:
         assert result["original_count"] == 3
         assert result["merged_count"] == 2  # Deduplicated
 
+    def test_merge_parallel_results_leaves_phase_results_untouched(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_123")
+        workflow_start_parallel_phase(["reviewer", "skeptic"], task_id="TASK_TEST_123")
+        workflow_complete_parallel_phase(
+            phase="reviewer",
+            concerns=[{"description": "Missing input validation"}],
+            task_id="TASK_TEST_123"
+        )
+        workflow_complete_parallel_phase(
+            phase="skeptic",
+            concerns=[{"description": "Missing input validation"}],
+            task_id="TASK_TEST_123"
+        )
+
+        result = workflow_merge_parallel_results(task_id="TASK_TEST_123")
+        assert result["merged_concerns"] == [
+            {"description": "Missing input validation", "source_phase": "reviewer"}
+        ]
+
+        state = json.loads((clean_tasks_dir / "TASK_TEST_123" / "state.json").read_text())
+        for phase_result in state["parallel_execution"]["results"].values():
+            assert "source_phase" not in phase_result["concerns"][0]
+
 
 class TestAssertions:
     """Test structured assertions."""
@@ -1101,6 +1330,56 @@ class TestErrorPatterns:
 
         assert result["count"] == 0
 
+    def test_match_error_reports_nested_signatures(self, clean_tasks_dir):
+        workflow_record_error_pattern("not found", "runtime", "Generic lookup failure")
+        workflow_record_error_pattern("module not found", "compile", "Install the module")
+
+        result = workflow_match_error(error_output="Error: Module not found: left-pad")
+
+        assert result["count"] == 2
+        assert result["total_patterns"] == 2
+        assert result["matches"][0]["solution"] == "Install the module"
+
+    def test_match_error_sees_patterns_recorded_after_earlier_match(self, clean_tasks_dir):
+        workflow_record_error_pattern("disk quota exceeded", "runtime", "Free space")
+        assert workflow_match_error(error_output="EACCES: permission denied")["count"] == 0
+
+        workflow_record_error_pattern("permission denied", "runtime", "Fix file modes")
+        result = workflow_match_error(error_output="EACCES: permission denied")
+
+        assert result["count"] == 1
+        assert result["matches"][0]["solution"] == "Fix file modes"
+
+    def test_failed_record_leaves_no_phantom_pattern(self, clean_tasks_dir, monkeypatch):
+        workflow_record_error_pattern("disk quota exceeded", "runtime", "Free space")
+
+        def fail_dump(data):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr(_state_mod, "_dump_json_line", fail_dump)
+            with pytest.raises(OSError):
+                workflow_record_error_pattern("permission denied", "runtime", "Fix file modes")
+
+        result = workflow_match_error(error_output="EACCES: permission denied")
+        assert result["count"] == 0
+        assert result["total_patterns"] == 1
+
+    def test_pattern_updates_append_then_compact(self, clean_tasks_dir):
+        patterns_file = clean_tasks_dir / ".error_patterns.jsonl"
+        workflow_record_error_pattern("Segfault in parser", "runtime", "Bump parser")
+        workflow_record_error_pattern("Segfault in parser", "runtime", "Bump parser")
+        assert len(patterns_file.read_text().splitlines()) == 2
+
+        workflow_record_error_pattern("Segfault in parser", "runtime", "Bump parser")
+        lines = patterns_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["times_seen"] == 3
+
+        result = workflow_match_error(error_output="fatal: Segfault in parser at 0x0")
+        assert result["total_patterns"] == 1
+        assert result["matches"][0]["times_seen"] == 3
+
 
 class TestAgentPerformance:
     """Test agent performance tracking."""
@@ -1159,6 +1438,35 @@ class TestAgentPerformance:
         assert "agents" in result
         assert result["total_concerns"] == 3
 
+    def test_agent_performance_picks_up_appended_entries(self, clean_tasks_dir):
+        from datetime import datetime, timedelta
+        performance_file = clean_tasks_dir / ".agent_performance.jsonl"
+        old = (datetime.now() - timedelta(days=60)).isoformat()
+        performance_file.write_text(
+            json.dumps({"agent": "skeptic", "concern_type": "high", "outcome": "valid", "timestamp": old}) + "\n"
+        )
+        assert workflow_get_agent_performance()["total_concerns"] == 0
+
+        _state_mod._record_agent_performance("skeptic", "high", "false_positive")
+        result = workflow_get_agent_performance(agent="skeptic")
+
+        assert result["total_concerns"] == 1
+        assert result["agents"]["skeptic"]["false_positive"] == 1
+        assert workflow_get_agent_performance(time_range_days=90)["total_concerns"] == 2
+
+    def test_agent_performance_filters_on_epoch_ts(self, clean_tasks_dir):
+        from datetime import datetime, timedelta
+        _state_mod._record_agent_performance("skeptic", "high", "valid")
+        performance_file = clean_tasks_dir / ".agent_performance.jsonl"
+        entry = json.loads(performance_file.read_text())
+        assert isinstance(entry["ts"], float)
+
+        # "ts" takes precedence over the ISO timestamp when present
+        entry["ts"] = (datetime.now() - timedelta(days=60)).timestamp()
+        performance_file.write_text(json.dumps(entry) + "\n")
+        assert workflow_get_agent_performance()["total_concerns"] == 0
+        assert workflow_get_agent_performance(time_range_days=90)["total_concerns"] == 1
+
 
 class TestOptionalPhases:
     """Test optional specialized phases."""
@@ -1306,6 +1614,18 @@ class TestEffortLevels:
         assert result["effort"] == "medium"
         assert result["mode"] == "fast"
 
+    def test_effort_follows_mode_change(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_224")
+        workflow_set_mode("full", task_id="TASK_TEST_224")
+        assert workflow_get_effort_level("developer", task_id="TASK_TEST_224")["mode"] == "full"
+
+        workflow_set_mode("minimal", task_id="TASK_TEST_224")
+        result = workflow_get_effort_level("developer", task_id="TASK_TEST_224")
+
+        assert result["mode"] == "minimal"
+        assert result["effort"] == "medium"
+        assert result["task_id"] == "TASK_TEST_224"
+
     def test_effort_default_no_task(self, clean_tasks_dir):
         result = workflow_get_effort_level("architect", task_id="NONEXISTENT")
 
@@ -1449,6 +1769,16 @@ class TestWorktreeSupport:
         assert result["success"] is True
         assert result["worktree"]["path"] == "/tmp/wt/TASK_TEST_WT_004"
 
+    def test_perms_template_lookup_memoized(self, tmp_path, monkeypatch):
+        template = tmp_path / "config" / "worktree-permissions.json"
+        template.parent.mkdir()
+        template.write_text("{}")
+        monkeypatch.setattr(_state_mod, "_perms_template_cache", {})
+
+        assert _state_mod._find_perms_template(str(tmp_path)) == str(template)
+        template.unlink()
+        assert _state_mod._find_perms_template(str(tmp_path)) == str(template)
+
     def test_create_worktree_rejects_duplicates(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_TEST_WT_005")
         workflow_create_worktree(task_id="TASK_TEST_WT_005")
@@ -2002,6 +2332,14 @@ class TestListTasksWorktree:
 
         assert task["worktree"] is None
 
+    def test_list_tasks_sees_state_changes_after_earlier_listing(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_LT_011")
+        list_tasks()
+        workflow_transition("developer", task_id="TASK_TEST_LT_011")
+
+        task = next(t for t in list_tasks() if t["task_id"] == "TASK_TEST_LT_011")
+        assert task["phase"] == "developer"
+
     def test_list_tasks_with_active_worktree(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_TEST_LT_002")
         workflow_create_worktree(task_id="TASK_TEST_LT_002")
@@ -2130,6 +2468,22 @@ class TestWorktreeRecycling:
         result = _find_recyclable_worktree()
         assert result is None
 
+    def test_find_recyclable_worktree_sees_later_status_change(self, clean_tasks_dir, tmp_path):
+        """A task skipped by an earlier scan is found once marked recyclable."""
+        workflow_initialize(task_id="TASK_TEST_RC_004")
+        workflow_create_worktree(task_id="TASK_TEST_RC_004", base_path=str(tmp_path))
+        (tmp_path / "TASK_TEST_RC_004").mkdir(exist_ok=True)
+        assert _find_recyclable_worktree() is None
+
+        state_file = clean_tasks_dir / "TASK_TEST_RC_004" / "state.json"
+        state = json.loads(state_file.read_text())
+        state["worktree"]["status"] = "recyclable"
+        state_file.write_text(json.dumps(state, indent=2))
+
+        task_dir, donor_state = _find_recyclable_worktree()
+        assert task_dir.name == "TASK_TEST_RC_004"
+        assert donor_state["worktree"]["status"] == "recyclable"
+
     def test_create_worktree_recycle_success(self, clean_tasks_dir, tmp_path):
         """recycle=True with a candidate returns move+checkout commands."""
         # Set up donor
@@ -2257,19 +2611,31 @@ class TestWorktreeRecycling:
 class TestWSLDetection:
     """Test WSL detection and worktree WSL-specific behavior."""
 
-    def test_is_wsl_false_on_linux(self):
+    def test_is_wsl_false_on_linux(self, monkeypatch):
         """_is_wsl returns False when /proc/version has no 'microsoft'."""
         from unittest.mock import mock_open, patch
+        monkeypatch.setattr(_state_mod, "_cached_is_wsl", None)
         m = mock_open(read_data="Linux version 5.15.0-generic (buildd@lgw01) (gcc 11.2.0)")
         with patch("builtins.open", m):
             assert _is_wsl() is False
 
-    def test_is_wsl_true_on_wsl(self):
+    def test_is_wsl_true_on_wsl(self, monkeypatch):
         """_is_wsl returns True when /proc/version contains 'microsoft'."""
         from unittest.mock import mock_open, patch
+        monkeypatch.setattr(_state_mod, "_cached_is_wsl", None)
+        m = mock_open(read_data="Linux version 5.15.90.1-microsoft-standard-WSL2")
+        with patch("builtins.open", m):
+            assert _is_wsl() is True
+
+    def test_is_wsl_reads_proc_version_once(self, monkeypatch):
+        """_is_wsl caches its answer for the life of the process."""
+        from unittest.mock import mock_open, patch
+        monkeypatch.setattr(_state_mod, "_cached_is_wsl", None)
         m = mock_open(read_data="Linux version 5.15.90.1-microsoft-standard-WSL2")
         with patch("builtins.open", m):
             assert _is_wsl() is True
+            assert _is_wsl() is True
+        assert m.call_count == 1
 
     def test_create_worktree_wsl_warning(self, clean_tasks_dir):
         """WSL + /mnt/ cwd produces a warning in the result."""
@@ -2497,6 +2863,16 @@ class TestInteractionLogging:
         assert json.loads(lines[1])["type"] == "checkpoint_question"
         assert json.loads(lines[2])["type"] == "checkpoint_response"
 
+    def test_log_uses_interactions_lock_file(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_TEST_INT_009")
+        task_dir = clean_tasks_dir / "TASK_TEST_INT_009"
+        workflow_log_interaction(role="human", content="one", task_id="TASK_TEST_INT_009")
+        workflow_log_interaction(role="human", content="two", task_id="TASK_TEST_INT_009")
+
+        assert (task_dir / "interactions.jsonl.lock").exists()
+        lines = (task_dir / "interactions.jsonl").read_text().strip().split("\n")
+        assert [json.loads(line)["content"] for line in lines] == ["one", "two"]
+
     def test_log_invalid_role(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_TEST_INT_004")
         result = workflow_log_interaction(
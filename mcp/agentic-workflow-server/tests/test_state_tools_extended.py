@@ -31,6 +31,7 @@ from agentic_workflow_server.state_tools import (
     workflow_can_stop,
     # Review
     workflow_add_review_issue,
+    workflow_add_review_issues,
     workflow_mark_docs_needed,
     # Implementation progress
     workflow_set_implementation_progress,
@@ -355,6 +356,29 @@ class TestAddReviewIssueEdgeCases:
         result = workflow_add_review_issue("bug", "Bug 3", task_id="TASK_EXT_032")
         assert result["total_issues"] == 3
 
+    def test_bulk_add_appends_all_issues(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_033")
+        workflow_add_review_issue("bug", "Bug 1", task_id="TASK_EXT_033")
+        result = workflow_add_review_issues([
+            {"issue_type": "bug", "description": "Bug 2", "step": "1.2"},
+            {"issue_type": "security", "description": "Bug 3", "severity": "high"},
+        ], task_id="TASK_EXT_033")
+        assert result["success"] is True
+        assert result["total_issues"] == 3
+        assert [i["severity"] for i in result["issues"]] == ["medium", "high"]
+        assert result["issues"][0]["step"] == "1.2"
+        state = workflow_get_state(task_id="TASK_EXT_033")
+        assert [i["description"] for i in state["review_issues"]] == ["Bug 1", "Bug 2", "Bug 3"]
+
+    def test_bulk_add_rejects_incomplete_issue(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_034")
+        result = workflow_add_review_issues([
+            {"issue_type": "bug", "description": "Bug 1"},
+            {"issue_type": "bug"},
+        ], task_id="TASK_EXT_034")
+        assert result["success"] is False
+        assert workflow_get_state(task_id="TASK_EXT_034")["review_issues"] == []
+
 
 # ============================================================================
 # workflow_mark_docs_needed edge cases
@@ -375,6 +399,13 @@ class TestMarkDocsNeededEdgeCases:
         assert "README.md" in result["all_files"]
         assert "NEW.md" in result["all_files"]
 
+    def test_keeps_existing_order_and_drops_repeats(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_043")
+        workflow_mark_docs_needed(["b.md", "a.md"], task_id="TASK_EXT_043")
+        result = workflow_mark_docs_needed(["c.md", "a.md", "c.md"], task_id="TASK_EXT_043")
+        assert result["added"] == ["c.md"]
+        assert result["all_files"] == ["b.md", "a.md", "c.md"]
+
     def test_empty_list(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_EXT_042")
         result = workflow_mark_docs_needed([], task_id="TASK_EXT_042")
@@ -592,11 +623,33 @@ class TestConcernsEdgeCases:
         )
         assert result["concern"]["id"] == "CUSTOM_001"
 
+    def test_address_concern_with_mixed_ids(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_125")
+        workflow_add_concern("skeptic", "high", "Custom", concern_id="C005", task_id="TASK_EXT_125")
+        generated = workflow_add_concern("reviewer", "low", "Generated", task_id="TASK_EXT_125")
+        assert generated["concern"]["id"] == "C002"
+
+        assert workflow_address_concern("C005", "step 1", task_id="TASK_EXT_125")["success"] is True
+        assert workflow_address_concern("C002", "step 2", task_id="TASK_EXT_125")["success"] is True
+
+        concerns = {c["id"]: c for c in workflow_get_concerns(task_id="TASK_EXT_125")["concerns"]}
+        assert concerns["C005"]["addressed_by"] == ["step 1"]
+        assert concerns["C002"]["addressed_by"] == ["step 2"]
+
     def test_address_nonexistent_concern(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_EXT_121")
         result = workflow_address_concern("NONEXISTENT", "step 1", task_id="TASK_EXT_121")
         assert result["success"] is False
 
+    def test_address_concern_twice_is_idempotent(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_124")
+        added = workflow_add_concern("reviewer", "high", "Issue", task_id="TASK_EXT_124")
+        concern_id = added["concern"]["id"]
+        workflow_address_concern(concern_id, "step 1", task_id="TASK_EXT_124")
+        result = workflow_address_concern(concern_id, "step 1", task_id="TASK_EXT_124")
+        assert result["success"] is True
+        assert result["concern"]["addressed_by"] == ["step 1"]
+
     def test_get_all_concerns(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_EXT_122")
         workflow_add_concern("reviewer", "high", "Issue 1", task_id="TASK_EXT_122")
@@ -643,6 +696,20 @@ class TestDiscoveriesEdgeCases:
         result = workflow_get_discoveries(task_id="TASK_EXT_132")
         assert result["count"] == 2
 
+    def test_flush_context_skips_blank_and_malformed_lines(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_134")
+        memory_dir = clean_tasks_dir / "TASK_EXT_134" / "memory"
+        memory_dir.mkdir(parents=True, exist_ok=True)
+        with open(memory_dir / "discoveries.jsonl", "w") as f:
+            f.write(json.dumps({"category": "pattern", "content": "A"}) + "\n")
+            f.write("\n   \n{broken\n")
+            f.write("  " + json.dumps({"category": "pattern", "content": "B"}) + "  \n")
+            f.write(json.dumps({"category": "gotcha", "content": "C"}) + "\n")
+
+        result = workflow_flush_context(task_id="TASK_EXT_134")
+        assert result["count"] == 3
+        assert result["by_category"] == {"pattern": 2, "gotcha": 1}
+
     def test_all_categories_valid(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_EXT_133")
         for cat in DISCOVERY_CATEGORIES:
@@ -675,6 +742,28 @@ class TestContextManagementEdgeCases:
         result = workflow_prune_old_outputs(task_id="TASK_EXT_141", keep_last_n=0)
         assert result["pruned_count"] >= 1
 
+    def test_prune_suffix_pattern_small_file(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_143")
+        task_dir = clean_tasks_dir / "TASK_EXT_143"
+        # *.log matches by suffix even when the file is small
+        (task_dir / "build.log").write_text("log line\n")
+        (task_dir / "notes.txt").write_text("small, not prunable\n")
+        result = workflow_prune_old_outputs(task_id="TASK_EXT_143", keep_last_n=0)
+        pruned = [p["file"] for p in result["pruned_files"]]
+        assert pruned == ["build.log"]
+        assert (task_dir / "notes.txt").exists()
+
+    def test_prune_summary_head_tail_of_large_file(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_144")
+        task_dir = clean_tasks_dir / "TASK_EXT_144"
+        lines = [f"line {i:05d} " + "y" * 200 + "\n" for i in range(2000)]
+        (task_dir / "repomix-output.txt").write_text("".join(lines))
+        workflow_prune_old_outputs(task_id="TASK_EXT_144", keep_last_n=0)
+        summary = json.loads((task_dir / "pruned" / "summaries.jsonl").read_text())
+        assert summary["total_lines"] == 2000
+        assert summary["head"] == "".join(lines[:10])
+        assert summary["tail"] == "".join(lines[-10:])
+
     def test_context_usage_with_nested_files(self, clean_tasks_dir):
         workflow_initialize(task_id="TASK_EXT_142")
         task_dir = clean_tasks_dir / "TASK_EXT_142"
@@ -684,6 +773,18 @@ class TestContextManagementEdgeCases:
         result = workflow_get_context_usage(task_id="TASK_EXT_142")
         assert result["file_count"] >= 2  # state.json + nested.txt
 
+    def test_context_usage_skips_pruned_dir(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_145")
+        task_dir = clean_tasks_dir / "TASK_EXT_145"
+        (task_dir / "pruned").mkdir()
+        (task_dir / "pruned" / "summaries.jsonl").write_text("{}\n" * 1000)
+        (task_dir / "memory").mkdir()
+        (task_dir / "memory" / "discoveries.jsonl").write_text("{}\n")
+        result = workflow_get_context_usage(task_id="TASK_EXT_145")
+        paths = [f["path"] for f in result["files"]]
+        assert not any(p.startswith("pruned") for p in paths)
+        assert str(Path("memory") / "discoveries.jsonl") in paths
+
 
 # ============================================================================
 # Cross-task memory edge cases
@@ -709,6 +810,23 @@ class TestCrossTaskMemoryEdgeCases:
         assert result["count"] == 1
         assert result["results"][0]["task_id"] == "TASK_EXT_151"
 
+    def test_search_matches_json_escaped_content(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_153")
+        workflow_save_discovery("gotcha", 'Naïve "retry" loop', task_id="TASK_EXT_153")
+        workflow_save_discovery("gotcha", "Unrelated note", task_id="TASK_EXT_153")
+
+        result = workflow_search_memories("naïve", task_ids=["TASK_EXT_153"])
+        assert result["count"] == 1
+        result = workflow_search_memories('"retry"', task_ids=["TASK_EXT_153"])
+        assert result["count"] == 1
+
+    def test_search_folds_non_ascii_case(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_154")
+        workflow_save_discovery("gotcha", "ÉCHEC during deploy", task_id="TASK_EXT_154")
+
+        result = workflow_search_memories("échec", task_ids=["TASK_EXT_154"])
+        assert result["count"] == 1
+
     def test_search_nonexistent_tasks_dir(self, clean_tasks_dir):
         """When task_ids list contains nonexistent tasks, they're skipped."""
         result = workflow_search_memories("anything", task_ids=["TASK_NONEXISTENT_999"])
@@ -765,6 +883,71 @@ class TestResilienceEdgeCases:
         result = workflow_record_model_error("test-model", "invalid_type")
         assert result["success"] is False
 
+    def test_concurrent_errors_are_not_lost(self, clean_tasks_dir):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: workflow_record_model_error("test-model-cc", "unknown"), range(40)))
+        status = workflow_get_resilience_status()
+        model = next(m for m in status["models"] if m["model"] == "test-model-cc")
+        assert model["total_errors"] == 40
+        assert not list(clean_tasks_dir.glob(".resilience_state.json.*.tmp"))
+
+    def test_error_history_is_bounded(self, clean_tasks_dir):
+        for i in range(15):
+            workflow_record_model_error("test-model-hist", "unknown", f"err {i}")
+        state = json.loads((clean_tasks_dir / ".resilience_state.json").read_text())
+        errors = state["models"]["test-model-hist"]["errors"]
+        assert len(errors) == 10
+        assert errors[0]["message"] == "err 5"
+        assert errors[-1]["message"] == "err 14"
+
+    def test_external_state_change_invalidates_cache(self, clean_tasks_dir):
+        workflow_record_model_error("test-model-ext", "auth")
+        workflow_get_resilience_status()
+        state_file = clean_tasks_dir / ".resilience_state.json"
+        state = json.loads(state_file.read_text())
+        state["models"]["test-model-ext"]["error_count"] = 99
+        state_file.write_text(json.dumps(state))
+        status = workflow_get_resilience_status()
+        model = next(m for m in status["models"] if m["model"] == "test-model-ext")
+        assert model["total_errors"] == 99
+
+    def test_clear_cooldown_on_healthy_model_skips_write(self, clean_tasks_dir):
+        workflow_record_model_error("test-model-ok", "unknown")
+        workflow_record_model_success("test-model-ok")
+        state_file = clean_tasks_dir / ".resilience_state.json"
+        mtime = state_file.stat().st_mtime_ns
+        result = workflow_clear_model_cooldown("test-model-ok")
+        assert result["success"] is True
+        assert state_file.stat().st_mtime_ns == mtime
+
+    def test_repeated_success_refreshes_last_success(self, clean_tasks_dir):
+        workflow_record_model_error("test-model-ok2", "unknown")
+        workflow_record_model_success("test-model-ok2")
+        state_file = clean_tasks_dir / ".resilience_state.json"
+        first = json.loads(state_file.read_text())["models"]["test-model-ok2"]["last_success"]
+        workflow_record_model_success("test-model-ok2")
+        second = json.loads(state_file.read_text())["models"]["test-model-ok2"]["last_success"]
+        assert second > first
+
+    def test_loaded_state_is_not_shared_between_calls(self, clean_tasks_dir):
+        from agentic_workflow_server.state_tools import _load_resilience_state
+        workflow_record_model_error("test-model-copy", "rate_limit")
+        first = _load_resilience_state()
+        first["models"]["test-model-copy"]["consecutive_errors"] = 42
+        assert _load_resilience_state()["models"]["test-model-copy"]["consecutive_errors"] == 1
+
+    def test_legacy_iso_cooldown_is_honored(self, clean_tasks_dir):
+        from datetime import datetime, timedelta
+        until = (datetime.now() + timedelta(seconds=300)).isoformat()
+        (clean_tasks_dir / ".resilience_state.json").write_text(json.dumps({
+            "models": {"test-model-iso": {"consecutive_errors": 1, "cooldown_until": until}},
+        }))
+        status = workflow_get_resilience_status()
+        model = next(m for m in status["models"] if m["model"] == "test-model-iso")
+        assert model["in_cooldown"] is True
+        assert 0 < model["cooldown_remaining_seconds"] <= 300
+
     def test_success_on_model_with_no_errors(self, clean_tasks_dir):
         result = workflow_record_model_success("fresh-model")
         assert result["success"] is True
@@ -806,6 +989,10 @@ class TestModeDetectionEdgeCases:
         result = workflow_detect_mode("FIX TYPO in README")
         assert result["mode"] == "minimal"
 
+    def test_overlapping_keywords_reported_in_rule_order(self):
+        result = workflow_detect_mode("Harden authentication flow")
+        assert result["matched_keywords"] == ["authentication", "auth"]
+
 
 # ============================================================================
 # Cost tracking edge cases
@@ -929,6 +1116,21 @@ class TestAssertionsEdgeCases:
             ids.append(r["assertion"]["id"])
         assert ids == ["A001", "A002", "A003", "A004", "A005"]
 
+    def test_assertion_ids_widen_past_999(self, clean_tasks_dir):
+        workflow_initialize(task_id="TASK_EXT_224")
+        state_file = clean_tasks_dir / "TASK_EXT_224" / "state.json"
+        state = json.loads(state_file.read_text())
+        state["assertions"] = [
+            {"id": f"A{i:03d}", "type": "file_exists", "status": "pending"}
+            for i in range(1, 1000)
+        ]
+        state_file.write_text(json.dumps(state))
+
+        r = workflow_add_assertion("file_exists", {"path": "a.ts"}, task_id="TASK_EXT_224")
+        assert r["assertion"]["id"] == "A1000"
+        result = workflow_verify_assertion("A1000", True, task_id="TASK_EXT_224")
+        assert result["success"] is True
+
 
 # ============================================================================
 # Error patterns edge cases
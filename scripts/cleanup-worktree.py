@@ -62,14 +62,14 @@ def load_state(state_file: Path) -> dict:
     if not state_file.exists():
         print(f"Error: State file not found: {state_file}", file=sys.stderr)
         sys.exit(1)
-    with open(state_file) as f:
+    with open(state_file, encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_state(state_file: Path, state: dict):
     """Write state back to state.json."""
     state["updated_at"] = datetime.now().isoformat()
-    with open(state_file, "w") as f:
+    with open(state_file, "w", encoding="utf-8") as f:
         json.dump(state, f, indent=2)
 
 
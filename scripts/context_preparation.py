@@ -418,7 +418,7 @@ Note documentation needs:
 
         state = {}
         if state_file.exists():
-            with open(state_file) as f:
+            with open(state_file, encoding="utf-8") as f:
                 state = json.load(f)
 
         state["context_preparation"] = {
@@ -435,7 +435,7 @@ Note documentation needs:
 
         state["updated_at"] = datetime.now().isoformat()
 
-        with open(state_file, "w") as f:
+        with open(state_file, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2)
 
     def prepare(self) -> ContextPreparationResult:
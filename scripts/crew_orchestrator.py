@@ -151,7 +151,7 @@ def _read_active_task() -> str | None:
         state_file = task_dir / "state.json"
         if not state_file.exists():
             return None
-        with open(state_file) as f:
+        with open(state_file, encoding="utf-8") as f:
             state = json.load(f)
         if state.get("status") == "completed":
             # Stale marker from a previous session — clean it up
@@ -52,7 +52,7 @@ def load_state(state_file: Path) -> dict:
     if not state_file.exists():
         print(f"Error: State file not found: {state_file}", file=sys.stderr)
         sys.exit(1)
-    with open(state_file) as f:
+    with open(state_file, encoding="utf-8") as f:
         return json.load(f)
 
 
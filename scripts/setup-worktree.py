@@ -412,7 +412,7 @@ def create_initial_state(task_id: str, description: str) -> dict:
 
 def load_state(state_file: Path) -> dict:
     if state_file.exists():
-        with open(state_file) as f:
+        with open(state_file, encoding="utf-8") as f:
             return json.load(f)
     return {}
 
@@ -420,7 +420,7 @@ def load_state(state_file: Path) -> dict:
 def save_state(state_file: Path, state: dict):
     state["updated_at"] = datetime.now().isoformat()
     state_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(state_file, "w") as f:
+    with open(state_file, "w", encoding="utf-8") as f:
         json.dump(state, f, indent=2)
 
 